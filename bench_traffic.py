@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Sweep traffic density vs. achieved tick rate and write a JSON report.
+
+For every combination of --vehicles x --walkers x --modes x --hybrid the
+harness spawns the traffic of ros2_making50.py with a fixed seed, runs
+--ticks ticks and records spawn time, tick latency distribution and the
+number of client calls (RPCs) during spawn and during the tick phase.
+
+    python3 bench_traffic.py --vehicles 0,50,100 --walkers 0,50 -o bench_report.json
+    python3 bench_traffic.py --fake          # no simulator, see fake_carla.py
+"""
+
+import argparse
+import collections
+import itertools
+import json
+import logging
+import platform
+import sys
+import time
+
+
+class CallCounter(collections.Counter):
+    def snapshot(self):
+        return collections.Counter(self)
+
+
+class CountingProxy:
+    """Counts every method call on a CARLA handle; handles it returns are wrapped too.
+
+    Arguments are unwrapped before the call, so the real (Boost.Python) API
+    never sees a proxy.
+    """
+
+    # methods whose results are server handles worth counting as well
+    WRAPPED_RESULTS = {"get_world", "get_trafficmanager", "get_actors", "try_spawn_actor", "spawn_actor"}
+
+    def __init__(self, target, counter: CallCounter, prefix: str):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_counter", counter)
+        object.__setattr__(self, "_prefix", prefix)
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        if not callable(value):
+            return value
+
+        def call(*args, **kwargs):
+            self._counter[f"{self._prefix}.{name}"] += 1
+            result = value(*[_unwrap(a) for a in args], **{k: _unwrap(v) for k, v in kwargs.items()})
+            if name in self.WRAPPED_RESULTS and result is not None:
+                prefix = {"get_world": "world", "get_trafficmanager": "tm"}.get(name, "actor")
+                return CountingProxy(result, self._counter, prefix)
+            return result
+        return call
+
+    def __setattr__(self, name, value):
+        setattr(self._target, name, value)
+
+    # ActorList
+    def __iter__(self):
+        return (CountingProxy(a, self._counter, "actor") for a in self._target)
+
+    def __getitem__(self, i):
+        return CountingProxy(self._target[i], self._counter, "actor")
+
+    def __len__(self):
+        return len(self._target)
+
+    def __bool__(self):
+        return bool(self._target)
+
+
+def _unwrap(value):
+    return value._target if isinstance(value, CountingProxy) else value
+
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    k = min(len(sorted_values) - 1, max(0, int(round(q / 100.0 * (len(sorted_values) - 1)))))
+    return sorted_values[k]
+
+
+def _latency_stats(samples):
+    values = sorted(samples)
+    if not values:
+        return {}
+    ms = lambda v: round(v * 1000.0, 3)
+    mean = sum(values) / len(values)
+    return {
+        "count": len(values),
+        "mean_ms": ms(mean),
+        "min_ms": ms(values[0]),
+        "p50_ms": ms(_percentile(values, 50)),
+        "p90_ms": ms(_percentile(values, 90)),
+        "p99_ms": ms(_percentile(values, 99)),
+        "max_ms": ms(values[-1]),
+        "achieved_hz": round(1.0 / mean, 2) if mean > 0 else None,
+    }
+
+
+def _calls(before, after):
+    diff = {k: after[k] - before.get(k, 0) for k in after if after[k] - before.get(k, 0)}
+    return dict(sorted(diff.items()), total=sum(diff.values()))
+
+
+def run_config(ctx, counter, n_vehicles, n_walkers, synchronous, hybrid, args):
+    from ros2_making50 import TrafficSpawner
+
+    world = ctx.world
+    original = world.get_settings()
+    settings = world.get_settings()
+    settings.synchronous_mode = synchronous
+    settings.fixed_delta_seconds = args.delta if synchronous else None
+    world.apply_settings(settings)
+
+    traffic = TrafficSpawner(ctx, n_vehicles=n_vehicles, n_walkers=n_walkers, tm_port=args.tm_port,
+                             hybrid=hybrid, seed=args.seed)
+    result = {
+        "vehicles": n_vehicles,
+        "walkers": n_walkers,
+        "mode": "sync" if synchronous else "async",
+        "hybrid": hybrid,
+    }
+    try:
+        calls0 = counter.snapshot()
+        t0 = time.monotonic()
+        traffic.setup()
+        result["spawn_s"] = round(time.monotonic() - t0, 4)
+        result["vehicles_spawned"] = len(traffic.vehicles_list)
+        result["walkers_spawned"] = len(traffic.walkers_list)
+        calls1 = counter.snapshot()
+
+        for _ in range(args.warmup):
+            traffic.tick()
+
+        samples = []
+        calls2 = counter.snapshot()
+        for _ in range(args.ticks):
+            t = time.monotonic()
+            traffic.tick()
+            samples.append(time.monotonic() - t)
+        calls3 = counter.snapshot()
+
+        result["tick"] = _latency_stats(samples)
+        result["calls"] = {"spawn": _calls(calls0, calls1), "tick": _calls(calls2, calls3)}
+        result["calls"]["tick_per_tick"] = round(result["calls"]["tick"]["total"] / max(args.ticks, 1), 3)
+    finally:
+        t0 = time.monotonic()
+        traffic.destroy()
+        # the TM must not stay synchronous once the world is not
+        ctx.traffic_manager(args.tm_port).set_synchronous_mode(False)
+        world.apply_settings(original)
+        result["teardown_s"] = round(time.monotonic() - t0, 4)
+    return result
+
+
+def main(args):
+    if args.fake:
+        import fake_carla
+        fake_carla.install()
+    from carla_context import CarlaContext
+
+    counter = CallCounter()
+    ctx = CarlaContext(args.host, args.port)
+    ctx.client = CountingProxy(ctx.client, counter, "client")
+    # fetch the map, blueprint library and TM once, so the first configuration
+    # doesn't pay for them in its spawn time and call counts
+    _ = ctx.spawn_points, ctx.blueprints
+    ctx.traffic_manager(args.tm_port)
+
+    vehicles = [int(x) for x in args.vehicles.split(",")]
+    walkers = [int(x) for x in args.walkers.split(",")]
+    modes = [m.strip() == "sync" for m in args.modes.split(",")]
+    hybrids = [h.strip() == "on" for h in args.hybrid.split(",")]
+
+    report = {
+        "meta": {
+            "backend": "fake" if args.fake else f"carla {args.host}:{args.port}",
+            "seed": args.seed,
+            "ticks": args.ticks,
+            "warmup": args.warmup,
+            "fixed_delta_seconds": args.delta,
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+        },
+        "results": [],
+    }
+
+    try:
+        for n_vehicles, n_walkers, synchronous, hybrid in itertools.product(vehicles, walkers, modes, hybrids):
+            logging.info("vehicles=%d walkers=%d mode=%s hybrid=%s", n_vehicles, n_walkers,
+                         "sync" if synchronous else "async", hybrid)
+            result = run_config(ctx, counter, n_vehicles, n_walkers, synchronous, hybrid, args)
+            report["results"].append(result)
+            if result["tick"]:
+                logging.info("  spawn %.2fs, tick mean %.2f ms p99 %.2f ms (%.1f Hz)",
+                             result["spawn_s"], result["tick"]["mean_ms"], result["tick"]["p99_ms"],
+                             result["tick"]["achieved_hz"])
+            else:
+                logging.info("  spawn %.2fs, no ticks measured", result["spawn_s"])
+    except KeyboardInterrupt:
+        print('\nCancelled by user. Writing partial report.')
+    finally:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        logging.info("Report written to %s (%d configurations)", args.output, len(report["results"]))
+
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description='Traffic density vs. tick rate benchmark')
+    argparser.add_argument('--host', metavar='H', default='127.0.0.1',
+                           help='IP of the host CARLA Simulator (default: 127.0.0.1)')
+    argparser.add_argument('--port', metavar='P', default=2000, type=int,
+                           help='TCP port of CARLA Simulator (default: 2000)')
+    argparser.add_argument('--vehicles', default='0,25,50,100',
+                           help='comma separated vehicle counts (default: %(default)s)')
+    argparser.add_argument('--walkers', default='0,50',
+                           help='comma separated walker counts (default: %(default)s)')
+    argparser.add_argument('--modes', default='sync,async',
+                           help='comma separated: sync, async (default: %(default)s)')
+    argparser.add_argument('--hybrid', default='off,on',
+                           help='comma separated hybrid physics settings: off, on (default: %(default)s)')
+    argparser.add_argument('--ticks', default=200, type=int,
+                           help='measured ticks per configuration (default: %(default)s)')
+    argparser.add_argument('--warmup', default=10, type=int,
+                           help='unmeasured ticks after spawning (default: %(default)s)')
+    argparser.add_argument('--delta', default=0.05, type=float,
+                           help='fixed_delta_seconds in sync mode (default: %(default)s)')
+    argparser.add_argument('-s', '--seed', default=42, type=int,
+                           help='random seed (default: %(default)s)')
+    argparser.add_argument('--tm-port', default=8005, type=int,
+                           help='Traffic Manager port (default: %(default)s)')
+    argparser.add_argument('--fake', action='store_true',
+                           help='run against the in-process fake backend (fake_carla.py)')
+    argparser.add_argument('-o', '--output', default='bench_report.json',
+                           help='JSON report path (default: %(default)s)')
+    argparser.add_argument('-v', '--verbose', action='store_true', dest='debug',
+                           help='print debug information')
+
+    args = argparser.parse_args()
+
+    log_level = logging.DEBUG if args.debug else logging.INFO
+    logging.basicConfig(format='%(levelname)s: %(message)s', level=log_level)
+
+    main(args)
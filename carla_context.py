@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""One CARLA client, world and map shared by every pipeline stage in a process.
+
+The expensive server round-trips (OpenDRIVE map, blueprint library, spawn points,
+topology) are fetched lazily on first use and cached, and each fetch and stage
+setup is timed for the startup report.
+"""
+
+import glob
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from functools import cached_property
+
+# ==============================================================================
+# CARLA 모듈 경로 설정
+# ==============================================================================
+try:
+    sys.path.append(glob.glob('../../../carla/dist/carla-*%d.%d-%s.egg' % (
+        sys.version_info.major,
+        sys.version_info.minor,
+        'win-amd64' if os.name == 'nt' else 'linux-x86_64'))[0])
+except IndexError:
+    pass
+
+import carla
+
+
+class BlueprintIndex:
+    """Blueprint library fetched once; pattern -> blueprint id lookups are cached.
+
+    Only ids are cached. make() and filter() return fresh copies on every call
+    (BlueprintLibrary.find returns by value), so attributes set for one actor
+    never leak into the next one of the same type.
+    """
+
+    def __init__(self, world):
+        self._library = world.get_blueprint_library()
+        self._ids = {}
+        self._filtered = {}
+
+    def resolve(self, pattern: str) -> str:
+        if pattern not in self._ids:
+            matches = self._library.filter(pattern)
+            if len(matches) == 0:
+                raise ValueError(f"no blueprint matches '{pattern}'")
+            self._ids[pattern] = matches[0].id
+        return self._ids[pattern]
+
+    def make(self, pattern: str):
+        return self._library.find(self.resolve(pattern))
+
+    def filter(self, pattern: str) -> list:
+        """All blueprints matching `pattern`, as fresh copies (like BlueprintLibrary.filter)."""
+        if pattern not in self._filtered:
+            self._filtered[pattern] = [bp.id for bp in self._library.filter(pattern)]
+        return [self._library.find(blueprint_id) for blueprint_id in self._filtered[pattern]]
+
+    def find(self, blueprint_id: str):
+        return self._library.find(blueprint_id)
+
+
+class CarlaContext:
+    """Lazily created, shared CARLA handles plus a per-stage startup-time report."""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 2000, timeout: float = 10.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.timings = {}
+        self._original_settings = None
+        self._traffic_managers = {}
+
+    @contextmanager
+    def timed(self, name: str):
+        t0 = time.monotonic()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.monotonic() - t0
+
+    @cached_property
+    def client(self):
+        with self.timed("client"):
+            client = carla.Client(self.host, self.port)
+            client.set_timeout(self.timeout)
+            return client
+
+    @cached_property
+    def world(self):
+        client = self.client
+        with self.timed("world"):
+            return client.get_world()
+
+    @cached_property
+    def map(self):
+        world = self.world
+        with self.timed("map"):
+            return world.get_map()
+
+    @cached_property
+    def spawn_points(self) -> list:
+        map_ = self.map
+        with self.timed("spawn_points"):
+            return map_.get_spawn_points()
+
+    @cached_property
+    def blueprints(self) -> BlueprintIndex:
+        world = self.world
+        with self.timed("blueprints"):
+            return BlueprintIndex(world)
+
+    @cached_property
+    def topology(self) -> list:
+        map_ = self.map
+        with self.timed("topology"):
+            return map_.get_topology()
+
+    def traffic_manager(self, port: int = 8000):
+        if port not in self._traffic_managers:
+            client = self.client
+            with self.timed("traffic_manager"):
+                self._traffic_managers[port] = client.get_trafficmanager(port)
+        return self._traffic_managers[port]
+
+    def enable_synchronous_mode(self, fixed_delta_seconds: float = 0.05):
+        """Switch the world to synchronous mode; restore_settings() undoes it."""
+        if self._original_settings is None:
+            self._original_settings = self.world.get_settings()
+        settings = self.world.get_settings()
+        settings.synchronous_mode = True
+        settings.fixed_delta_seconds = fixed_delta_seconds
+        self.world.apply_settings(settings)
+
+    @property
+    def synchronous_mode(self) -> bool:
+        return self.world.get_settings().synchronous_mode
+
+    def restore_settings(self):
+        if self._original_settings is not None:
+            self.world.apply_settings(self._original_settings)
+            self._original_settings = None
+
+    def report(self):
+        """Log the startup time spent per stage and per shared resource.
+
+        Resource fetches are included in the time of the stage that triggered them.
+        """
+        if not self.timings:
+            return
+        width = max(len(name) for name in self.timings)
+        logging.info("Startup time:")
+        for name, seconds in self.timings.items():
+            logging.info("  %-*s %7.3f s", width, name, seconds)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Run any combination of the pipeline scripts in one process over one CARLA client.
+
+    python3 carla_launcher.py --stages path,obstacles,bridge,traffic -f tesla.json
+
+Stages (set up in this order, torn down in reverse):
+  path       ros2_dijkstra_path_generator.py  (writes global_path.csv once)
+  obstacles  spwan_fixed_obstacles.py
+  bridge     ros2_native.py                   (needs --file)
+  traffic    ros2_making50.py
+
+The map, spawn points, blueprint library and topology are fetched once through
+CarlaContext and shared; startup time per stage and resource is reported.
+"""
+
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+
+from carla_context import CarlaContext
+from tick_scheduler import DEADLINE_POLICIES, TickScheduler
+
+STAGES = ("path", "obstacles", "bridge", "traffic")
+
+
+def main(args):
+    t_launch = time.monotonic()
+
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+    unknown = [s for s in stages if s not in STAGES]
+    if unknown:
+        raise SystemExit(f"unknown stage(s): {', '.join(unknown)} (choose from {', '.join(STAGES)})")
+    if "bridge" in stages and not args.file:
+        raise SystemExit("the bridge stage needs --file")
+
+    ctx = CarlaContext(args.host, args.port)
+    uses_ros = "path" in stages or "bridge" in stages
+    if uses_ros:
+        import rclpy
+        rclpy.init(args=None)
+
+    teardown = []
+    bridge = None
+    synchronous = args.sync or "bridge" in stages
+
+    try:
+        if synchronous:
+            ctx.enable_synchronous_mode(0.05)
+
+        if "path" in stages:
+            from ros2_dijkstra_path_generator import DijkstraPathGenerator
+            with ctx.timed("stage:path"):
+                node = DijkstraPathGenerator(ctx, plot=args.plot)
+                node.destroy_node()
+
+        if "obstacles" in stages:
+            from spwan_fixed_obstacles import spawn_obstacles, destroy_obstacles
+            with ctx.timed("stage:obstacles"):
+                obstacles = spawn_obstacles(ctx)
+            teardown.append(lambda: destroy_obstacles(ctx, obstacles))
+
+        if "bridge" in stages:
+            # after "path", so a tracker config can use the route it just wrote
+            from ros2_native import Bridge, parse_rig_config
+            with ctx.timed("stage:bridge"):
+                with open(args.file) as f:
+                    specs = parse_rig_config(json.load(f))
+                bridge = Bridge(ctx, specs, encode_workers=args.encode_workers,
+                                callback_threads=args.callback_threads,
+                                governor=not args.no_governor, tick_budget=args.governor_tick_budget or None)
+                teardown.append(bridge.destroy)
+                bridge.setup()
+
+        if "traffic" in stages:
+            from ros2_making50 import TrafficSpawner
+            with ctx.timed("stage:traffic"):
+                traffic = TrafficSpawner(ctx, n_vehicles=args.vehicles, n_walkers=args.walkers,
+                                         tm_port=args.tm_port)
+                teardown.append(traffic.destroy)
+                traffic.setup()
+
+        ctx.report()
+        logging.info("Stages %s up in %.2fs.", ",".join(stages), time.monotonic() - t_launch)
+
+        if not synchronous and "traffic" not in stages:
+            # nothing to tick; keep spawned obstacles until Ctrl+C like the standalone script
+            if teardown:
+                logging.info("Press Ctrl+C to exit.")
+                stop = threading.Event()
+                while not stop.wait(1.0):
+                    pass
+            return
+
+        logging.info("Press Ctrl+C to exit.")
+
+        def _tick():
+            t0 = time.monotonic()
+            if synchronous:
+                ctx.world.tick()
+            else:
+                # the server paces asynchronous worlds; wait for its next frame
+                ctx.world.wait_for_tick()
+            if bridge is not None:
+                bridge.on_tick(time.monotonic() - t0)
+
+        scheduler = TickScheduler(_tick, rate_hz=args.rate if synchronous else 0.0,
+                                  deadline_policy=args.deadline)
+        scheduler.run(keep_running=rclpy.ok if uses_ros else (lambda: True))
+
+    except KeyboardInterrupt:
+        print('\nCancelled by user. Bye!')
+
+    finally:
+        ctx.restore_settings()
+        for destroy in reversed(teardown):
+            try:
+                destroy()
+            except Exception as e:
+                logging.warning("cleanup failed: %s", e)
+        if uses_ros:
+            rclpy.shutdown()
+
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description='Run CARLA pipeline stages in one process over one client')
+    argparser.add_argument('--host', metavar='H', default='127.0.0.1',
+                           help='IP of the host CARLA Simulator (default: 127.0.0.1)')
+    argparser.add_argument('--port', metavar='P', default=2000, type=int,
+                           help='TCP port of CARLA Simulator (default: 2000)')
+    argparser.add_argument('--stages', default=",".join(STAGES),
+                           help='comma separated stages to run (default: %(default)s)')
+    argparser.add_argument('-f', '--file', default='',
+                           help='vehicle config for the bridge stage (e.g. tesla.json)')
+    argparser.add_argument('--vehicles', default=50, type=int,
+                           help='traffic stage: number of autopilot vehicles (default: 50)')
+    argparser.add_argument('--walkers', default=50, type=int,
+                           help='traffic stage: number of walkers (default: 50)')
+    argparser.add_argument('--tm-port', default=8005, type=int,
+                           help='traffic stage: Traffic Manager port (default: 8005)')
+    argparser.add_argument('--sync', action='store_true',
+                           help='run synchronous even without the bridge stage')
+    argparser.add_argument('--plot', action='store_true',
+                           help='path stage: show the route plot (blocks until closed)')
+    argparser.add_argument('--encode-workers', metavar='N', default=os.cpu_count() or 4, type=int,
+                           help='bridge stage: worker threads for compressed image outputs')
+    argparser.add_argument('--rate', metavar='HZ', default=0.0, type=float,
+                           help='target tick rate in synchronous mode, 0 = as fast as possible (default: 0)')
+    argparser.add_argument('--deadline', choices=DEADLINE_POLICIES, default='skip',
+                           help='what to do when a tick overruns its slot (default: skip)')
+    argparser.add_argument('--callback-threads', metavar='N', default=4, type=int,
+                           help='bridge stage: threads servicing ROS callbacks (default: 4)')
+    argparser.add_argument('--no-governor', action='store_true',
+                           help='bridge stage: never lower publish rate or resolution of sensors under load')
+    argparser.add_argument('--governor-tick-budget', metavar='SEC', default=0.0, type=float,
+                           help='bridge stage: also shed sensor load when a tick takes longer than this (default: 0 = off)')
+    argparser.add_argument('-v', '--verbose', action='store_true', dest='debug',
+                           help='print debug information')
+
+    args = argparser.parse_args()
+
+    log_level = logging.DEBUG if args.debug else logging.INFO
+    logging.basicConfig(format='%(levelname)s: %(message)s', level=log_level)
+
+    main(args)
@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""In-memory stand-in for the parts of the carla module used by ros2_making50.py.
+
+Only meant for bench_traffic.py --fake: it lets the harness and the traffic
+spawner run without a simulator. Tick cost is synthetic (a fixed base plus a
+per-actor cost, cheaper for vehicles under hybrid physics) so that the sweep
+shows a load-dependent curve; the numbers say nothing about a real server.
+"""
+
+import fnmatch
+import random
+import sys
+import time
+import types
+
+# synthetic server cost per tick [s]
+TICK_BASE = 0.002
+TICK_PER_VEHICLE = 0.00015
+TICK_PER_VEHICLE_HYBRID = 0.00004
+TICK_PER_WALKER = 0.00008
+
+N_SPAWN_POINTS = 200
+
+
+class Location:
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x, self.y, self.z = float(x), float(y), float(z)
+
+
+class Rotation:
+    def __init__(self, pitch=0.0, yaw=0.0, roll=0.0):
+        self.pitch, self.yaw, self.roll = float(pitch), float(yaw), float(roll)
+
+
+class Transform:
+    def __init__(self, location=None, rotation=None):
+        self.location = Location(location.x, location.y, location.z) if location else Location()
+        self.rotation = Rotation(rotation.pitch, rotation.yaw, rotation.roll) if rotation else Rotation()
+
+
+class VehicleControl:
+    def __init__(self, throttle=0.0, steer=0.0, brake=0.0, hand_brake=False, reverse=False):
+        self.throttle, self.steer, self.brake = throttle, steer, brake
+        self.hand_brake, self.reverse = hand_brake, reverse
+
+
+class VehicleLightState:
+    NONE = 0
+
+
+class ActorAttribute:
+    def __init__(self, value, recommended_values=()):
+        self.value = str(value)
+        self.recommended_values = list(recommended_values)
+
+    def __int__(self):
+        return int(self.value)
+
+    def __str__(self):
+        return self.value
+
+
+class ActorBlueprint:
+    def __init__(self, blueprint_id, attributes=None):
+        self.id = blueprint_id
+        self.tags = blueprint_id.split(".")
+        self._attributes = dict(attributes or {})
+
+    def has_attribute(self, name):
+        return name in self._attributes
+
+    def get_attribute(self, name):
+        return self._attributes[name]
+
+    def set_attribute(self, name, value):
+        recommended = self._attributes[name].recommended_values if name in self._attributes else ()
+        self._attributes[name] = ActorAttribute(value, recommended)
+
+    def _copy(self):
+        return ActorBlueprint(self.id, self._attributes)
+
+
+class BlueprintLibrary:
+    def __init__(self, blueprints):
+        self._blueprints = list(blueprints)
+
+    def filter(self, pattern):
+        return BlueprintLibrary(bp._copy() for bp in self._blueprints
+                                if fnmatch.fnmatch(bp.id, pattern) or pattern in bp.tags)
+
+    def find(self, blueprint_id):
+        for bp in self._blueprints:
+            if bp.id == blueprint_id:
+                # like the real API, find() returns the blueprint by value
+                return bp._copy()
+        raise IndexError(f"blueprint '{blueprint_id}' not found")
+
+    def __iter__(self):
+        return iter(self._blueprints)
+
+    def __len__(self):
+        return len(self._blueprints)
+
+    def __getitem__(self, i):
+        return self._blueprints[i]
+
+
+def _default_library():
+    colors = ActorAttribute("0,0,0", ["255,0,0", "0,255,0", "0,0,255"])
+    blueprints = []
+    for name in ("tesla.model3", "audi.a2", "toyota.prius", "nissan.patrol", "mini.cooper_s"):
+        blueprints.append(ActorBlueprint("vehicle." + name, {
+            "number_of_wheels": ActorAttribute(4), "color": colors, "role_name": ActorAttribute(""),
+            "ros_name": ActorAttribute(""),
+        }))
+    blueprints.append(ActorBlueprint("vehicle.bh.crossbike", {
+        "number_of_wheels": ActorAttribute(2), "role_name": ActorAttribute(""),
+    }))
+    for i in range(1, 9):
+        blueprints.append(ActorBlueprint("walker.pedestrian.%04d" % i, {"is_invincible": ActorAttribute("true")}))
+    blueprints.append(ActorBlueprint("controller.ai.walker"))
+    for name in ("constructioncone", "streetbarrier", "box01", "barrel", "trashcan01", "tire", "warningconstruction"):
+        blueprints.append(ActorBlueprint("static.prop." + name))
+    return BlueprintLibrary(blueprints)
+
+
+class Actor:
+    def __init__(self, world, actor_id, blueprint, transform, parent=None):
+        self.world = world
+        self.id = actor_id
+        self.type_id = blueprint.id
+        self.attributes = {k: str(v) for k, v in blueprint._attributes.items()}
+        self.parent = parent
+        self._transform = transform
+        self.is_alive = True
+
+    def get_transform(self):
+        return self._transform
+
+    def set_simulate_physics(self, enabled=True):
+        pass
+
+    def set_autopilot(self, enabled=True, tm_port=8000):
+        pass
+
+    def apply_control(self, control):
+        pass
+
+    # walker controller
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def go_to_location(self, location):
+        pass
+
+    def set_max_speed(self, speed):
+        pass
+
+    def destroy(self):
+        return self.world._destroy(self.id)
+
+
+class ActorList(list):
+    def find(self, actor_id):
+        for actor in self:
+            if actor.id == actor_id:
+                return actor
+        return None
+
+
+class WorldSettings:
+    def __init__(self):
+        self.synchronous_mode = False
+        self.fixed_delta_seconds = None
+        self.no_rendering_mode = False
+
+    def _copy(self):
+        settings = WorldSettings()
+        settings.__dict__.update(self.__dict__)
+        return settings
+
+
+class Map:
+    name = "FakeTown"
+
+    def __init__(self):
+        rng = random.Random(0)
+        self._spawn_points = [
+            Transform(Location(rng.uniform(-200, 200), rng.uniform(-200, 200), 0.5), Rotation(yaw=rng.choice((0, 90, 180, 270))))
+            for _ in range(N_SPAWN_POINTS)
+        ]
+
+    def get_spawn_points(self):
+        return [Transform(sp.location, sp.rotation) for sp in self._spawn_points]
+
+    def get_topology(self):
+        return []
+
+
+class World:
+    def __init__(self, client):
+        self._client = client
+        self._settings = WorldSettings()
+        self._library = _default_library()
+        self._map = Map()
+        self._actors = {}
+        self._next_id = 100
+        self._frame = 0
+
+    def get_settings(self):
+        return self._settings._copy()
+
+    def apply_settings(self, settings):
+        self._settings = settings._copy()
+        return self._frame
+
+    def get_blueprint_library(self):
+        return self._library
+
+    def get_map(self):
+        return self._map
+
+    def get_spectator(self):
+        return Actor(self, 0, ActorBlueprint("spectator"), Transform())
+
+    def _occupied(self, location):
+        for actor in self._actors.values():
+            if actor.parent is None and actor.type_id.startswith("vehicle."):
+                loc = actor.get_transform().location
+                if abs(loc.x - location.x) < 2.0 and abs(loc.y - location.y) < 2.0:
+                    return True
+        return False
+
+    def _spawn(self, blueprint, transform, parent=None):
+        if parent is None and blueprint.id.startswith("vehicle.") and self._occupied(transform.location):
+            raise RuntimeError("Spawn failed because of collision at spawn position")
+        actor = Actor(self, self._next_id, blueprint, Transform(transform.location, transform.rotation), parent)
+        self._actors[actor.id] = actor
+        self._next_id += 1
+        return actor
+
+    def _destroy(self, actor_id):
+        actor = self._actors.pop(actor_id, None)
+        if actor is not None:
+            actor.is_alive = False
+        return actor is not None
+
+    def spawn_actor(self, blueprint, transform, attach_to=None):
+        return self._spawn(blueprint, transform, attach_to)
+
+    def try_spawn_actor(self, blueprint, transform, attach_to=None):
+        try:
+            return self._spawn(blueprint, transform, attach_to)
+        except RuntimeError:
+            return None
+
+    def get_actors(self, actor_ids=None):
+        if actor_ids is None:
+            return ActorList(self._actors.values())
+        return ActorList(self._actors[i] for i in actor_ids if i in self._actors)
+
+    def get_random_location_from_navigation(self):
+        return Location(random.uniform(-200, 200), random.uniform(-200, 200), 0.2)
+
+    def set_pedestrians_cross_factor(self, factor):
+        pass
+
+    def set_pedestrians_seed(self, seed):
+        random.seed(seed)
+
+    def _step(self):
+        n_vehicles = sum(1 for a in self._actors.values() if a.type_id.startswith("vehicle."))
+        n_walkers = sum(1 for a in self._actors.values() if a.type_id.startswith("walker."))
+        hybrid = any(tm.hybrid for tm in self._client._traffic_managers.values())
+        per_vehicle = TICK_PER_VEHICLE_HYBRID if hybrid else TICK_PER_VEHICLE
+        time.sleep(TICK_BASE + per_vehicle * n_vehicles + TICK_PER_WALKER * n_walkers)
+        self._frame += 1
+        return self._frame
+
+    def tick(self, seconds=10.0):
+        if not self._settings.synchronous_mode:
+            raise RuntimeError("tick() called in asynchronous mode")
+        return self._step()
+
+    def wait_for_tick(self, seconds=10.0):
+        self._step()
+        return types.SimpleNamespace(frame=self._frame)
+
+
+class TrafficManager:
+    """Accepts every Traffic Manager setter; only hybrid physics changes the fake tick cost."""
+
+    def __init__(self, port):
+        self.port = port
+        self.hybrid = False
+        self.synchronous = False
+
+    def set_hybrid_physics_mode(self, enabled=True):
+        self.hybrid = bool(enabled)
+
+    def set_synchronous_mode(self, enabled=True):
+        self.synchronous = bool(enabled)
+
+    def get_port(self):
+        return self.port
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: None
+
+
+class Client:
+    def __init__(self, host="127.0.0.1", port=2000, worker_threads=0):
+        self.host, self.port = host, port
+        self._world = World(self)
+        self._traffic_managers = {}
+
+    def set_timeout(self, seconds):
+        pass
+
+    def get_world(self):
+        return self._world
+
+    def get_trafficmanager(self, port=8000):
+        if port not in self._traffic_managers:
+            self._traffic_managers[port] = TrafficManager(port)
+        return self._traffic_managers[port]
+
+    def apply_batch_sync(self, commands, do_tick=False):
+        responses = []
+        for cmd in commands:
+            try:
+                responses.append(command.Response(cmd._run(self._world), ""))
+            except RuntimeError as e:
+                responses.append(command.Response(0, str(e)))
+        if do_tick and self._world._settings.synchronous_mode:
+            self._world.tick()
+        return responses
+
+    def apply_batch(self, commands, do_tick=False):
+        self.apply_batch_sync(commands, do_tick)
+
+
+# ==============================================================================
+# carla.command
+# ==============================================================================
+
+class _Command:
+    def __init__(self):
+        self._then = []
+
+    def then(self, cmd):
+        self._then.append(cmd)
+        return self
+
+    def _run(self, world, future=None):
+        actor_id = self._apply(world, future)
+        for cmd in self._then:
+            cmd._run(world, actor_id)
+        return actor_id
+
+
+class _FutureActor:
+    pass
+
+
+class SpawnActor(_Command):
+    def __init__(self, blueprint, transform, parent=None):
+        super().__init__()
+        # like the real command, the blueprint is copied when the command is created
+        self.blueprint = blueprint._copy()
+        self.transform = Transform(transform.location, transform.rotation)
+        self.parent = parent
+
+    def _apply(self, world, future):
+        parent = world._actors.get(self.parent) if isinstance(self.parent, int) else None
+        return world._spawn(self.blueprint, self.transform, parent).id
+
+
+class SetAutopilot(_Command):
+    def __init__(self, actor, enabled, tm_port=8000):
+        super().__init__()
+        self.actor = actor
+
+    def _apply(self, world, future):
+        actor_id = future if self.actor is _FutureActor else self.actor
+        if actor_id not in world._actors:
+            raise RuntimeError(f"actor {actor_id} not found")
+        return actor_id
+
+
+class DestroyActor(_Command):
+    def __init__(self, actor):
+        super().__init__()
+        self.actor = actor
+
+    def _apply(self, world, future):
+        actor_id = self.actor.id if isinstance(self.actor, Actor) else self.actor
+        if not world._destroy(actor_id):
+            raise RuntimeError(f"actor {actor_id} not found")
+        return actor_id
+
+
+class Response:
+    def __init__(self, actor_id, error):
+        self.actor_id = actor_id
+        self.error = error
+
+    def has_error(self):
+        return bool(self.error)
+
+
+command = types.ModuleType(__name__ + ".command")
+command.SpawnActor = SpawnActor
+command.SetAutopilot = SetAutopilot
+command.DestroyActor = DestroyActor
+command.FutureActor = _FutureActor
+command.Response = Response
+
+
+def install():
+    """Make `import carla` / `from carla.command import ...` resolve to this module."""
+    module = sys.modules[__name__]
+    sys.modules["carla"] = module
+    sys.modules["carla.command"] = command
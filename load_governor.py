@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Adaptive per-sensor publish rate and resolution under load.
+
+Every sensor stream of the bridge has a StreamLoad: its priority, its bounds
+(max decimation, min scale) and the time spent processing its frames. The
+LoadGovernor looks at one window of ticks at a time. When a stream's
+processing takes too much of a core, its encode queue fills up or frames are
+dropped, it degrades the lowest-priority streams that still have
+headroom (first publish every 2nd, 4th, ... frame, then halve the image
+size); once the load stays low for a few windows it restores them, highest
+priority first. Streams with the default bounds are never touched.
+
+The tick time is only a trigger when a tick budget is given: the streams run in
+client threads, so shedding them rarely makes a slow server tick faster.
+"""
+
+import threading
+from typing import List, NamedTuple, Optional
+
+PRIORITIES = {"low": 0, "normal": 1, "high": 2}
+
+
+class StreamLoad:
+    """Load statistics and current degradation of one sensor stream."""
+
+    def __init__(self, name: str, priority: str = "normal", max_decimation: int = 1,
+                 min_scale: float = 1.0, can_scale: bool = False):
+        self.name = name
+        self.priority = priority
+        self.rank = PRIORITIES[priority]
+        self.max_decimation = max_decimation
+        self.min_scale = min_scale if can_scale else 1.0
+
+        self.decimation = 1
+        self.scale = 1.0
+
+        # (pending, capacity) of the stream's work queue, if it has one
+        self.queue_fn = None
+        self.dropped_fn = None
+
+        self._lock = threading.Lock()
+        self._frame = 0
+        self._frames = 0
+        self._busy = 0.0
+        self._dropped_seen = 0
+
+    @property
+    def adjustable(self) -> bool:
+        return self.rank < PRIORITIES["high"] and (self.max_decimation > 1 or self.min_scale < 1.0)
+
+    @property
+    def degraded(self) -> bool:
+        return self.decimation > 1 or self.scale < 1.0
+
+    def admit(self) -> bool:
+        """Count an incoming frame; False if decimation drops it."""
+        with self._lock:
+            self._frame += 1
+            return self._frame % self.decimation == 0
+
+    def record(self, seconds: float, frame: bool = True):
+        """Add processing time; frame=False for later work (e.g. encoding) on a counted frame."""
+        with self._lock:
+            if frame:
+                self._frames += 1
+            self._busy += seconds
+
+    def take_window(self, wall: float) -> dict:
+        with self._lock:
+            frames, busy = self._frames, self._busy
+            self._frames, self._busy = 0, 0.0
+
+        dropped = 0
+        if self.dropped_fn is not None:
+            total = self.dropped_fn()
+            dropped, self._dropped_seen = total - self._dropped_seen, total
+        queue = 0.0
+        if self.queue_fn is not None:
+            pending, capacity = self.queue_fn()
+            queue = pending / capacity if capacity else 0.0
+
+        return {
+            "frames": frames,
+            "proc_ms": busy / frames * 1000.0 if frames else 0.0,
+            # share of one core spent on this stream
+            "load": busy / wall if wall > 0 else 0.0,
+            "queue": queue,
+            "dropped": dropped,
+        }
+
+    def degrade(self) -> bool:
+        if self.decimation < self.max_decimation:
+            self.decimation = min(self.decimation * 2, self.max_decimation)
+            return True
+        if self.scale > self.min_scale:
+            self.scale = max(self.scale / 2.0, self.min_scale)
+            return True
+        return False
+
+    def restore(self) -> bool:
+        if self.scale < 1.0:
+            self.scale = min(self.scale * 2.0, 1.0)
+            return True
+        if self.decimation > 1:
+            self.decimation = max(self.decimation // 2, 1)
+            return True
+        return False
+
+
+class Adjustment(NamedTuple):
+    stream: StreamLoad
+    decimation: int
+    scale: float
+    reason: str
+    stats: dict
+
+
+class LoadGovernor:
+    """Degrades/restores StreamLoads from per-window processing time and queue depth.
+
+    With `tick_budget` set, the tick time relative to it is an extra trigger.
+    """
+
+    def __init__(self, tick_budget: Optional[float] = None, window_ticks: int = 20, high_water: float = 0.9,
+                 low_water: float = 0.6, recover_windows: int = 3):
+        self.tick_budget = tick_budget
+        self.window_ticks = window_ticks
+        self.high_water = high_water
+        self.low_water = low_water
+        self.recover_windows = recover_windows
+
+        self.streams: List[StreamLoad] = []
+        self._ticks = 0
+        self._tick_time = 0.0
+        self._wall = 0.0
+        self._calm = 0
+
+    def add(self, stream: StreamLoad) -> StreamLoad:
+        self.streams.append(stream)
+        return stream
+
+    def on_tick(self, tick_seconds: float, wall_seconds: float) -> List[Adjustment]:
+        """Feed one tick; returns the adjustments made at the end of a window (usually none)."""
+        self._ticks += 1
+        self._tick_time += tick_seconds
+        self._wall += wall_seconds
+        if self._ticks < self.window_ticks:
+            return []
+
+        wall = self._wall
+        tick_time = self._tick_time / self._ticks
+        self._ticks, self._tick_time, self._wall = 0, 0.0, 0.0
+
+        stats = {s.name: s.take_window(wall) for s in self.streams}
+        reason, load = "streams idle", 0.0
+        if self.tick_budget:
+            load = tick_time / self.tick_budget
+            reason = "tick {:.0f}% of budget".format(load * 100.0)
+        dropped = 0
+        for name, st in stats.items():
+            dropped += st["dropped"]
+            for key, label in (("load", "processing"), ("queue", "queue")):
+                if st[key] > load:
+                    reason, load = "{} {} {:.0f}%".format(name, label, st[key] * 100.0), st[key]
+        if dropped:
+            reason = "{} frames dropped; {}".format(dropped, reason)
+
+        adjustable = [s for s in self.streams if s.adjustable]
+        if load > self.high_water or dropped:
+            self._calm = 0
+            changed = self._step(adjustable, degrade=True)
+        elif load < self.low_water:
+            self._calm += 1
+            if self._calm < self.recover_windows:
+                return []
+            self._calm = 0
+            changed = self._step(adjustable, degrade=False)
+            reason = "load back to {:.0f}%".format(load * 100.0)
+        else:
+            self._calm = 0
+            return []
+
+        return [Adjustment(s, s.decimation, s.scale, reason, stats[s.name]) for s in changed]
+
+    def _step(self, streams: List[StreamLoad], degrade: bool) -> List[StreamLoad]:
+        """Adjust every stream of the lowest (degrade) / highest (restore) priority that can move."""
+        ranks = sorted({s.rank for s in streams}, reverse=not degrade)
+        for rank in ranks:
+            group = [s for s in streams if s.rank == rank]
+            changed = [s for s in group if (s.degrade() if degrade else s.restore())]
+            if changed:
+                return changed
+        return []
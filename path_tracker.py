@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Pure-pursuit tracking of the route exported by ros2_dijkstra_path_generator.py.
+
+The route CSV holds "x,y" per line, relative to the first route point, in CARLA
+world axes. ros2_native.py runs the tracker inside its tick loop, so the control
+computed from the state after tick N is applied before tick N+1.
+"""
+
+import math
+
+import numpy as np
+
+
+def load_route_csv(path: str) -> np.ndarray:
+    """Load an (N, 2) route from the generator's CSV export."""
+    points = np.loadtxt(path, delimiter=",", ndmin=2, dtype=np.float64)
+    if points.shape[1] != 2:
+        raise ValueError(f"{path}: expected 'x,y' per line, got {points.shape[1]} columns")
+
+    # drop repeated points, they would create zero-length segments
+    keep = np.ones(len(points), dtype=bool)
+    keep[1:] = np.any(np.diff(points, axis=0) != 0.0, axis=1)
+    points = points[keep]
+    if len(points) < 2:
+        raise ValueError(f"{path}: route needs at least 2 distinct points")
+    return points
+
+
+class RouteIndex:
+    """Polyline with a precomputed arc-length table for O(log N) lookahead queries."""
+
+    def __init__(self, points: np.ndarray):
+        self.points = np.asarray(points, dtype=np.float64)
+        seg = np.diff(self.points, axis=0)
+        self.seg_len = np.hypot(seg[:, 0], seg[:, 1])
+        self.seg_dir = seg / self.seg_len[:, None]
+        self.s = np.concatenate(([0.0], np.cumsum(self.seg_len)))
+        self.length = float(self.s[-1])
+
+    def project(self, x: float, y: float, s_hint: float = 0.0, window: float = 30.0):
+        """Project (x, y) onto the route near arc length s_hint.
+
+        Only segments in [s_hint - window/4, s_hint + window] are searched, so the
+        projection can't jump to another pass over the same road.
+        Returns (s, signed cross-track error; + is right of the route).
+        """
+        lo = max(int(np.searchsorted(self.s, s_hint - window * 0.25, side="right")) - 1, 0)
+        hi = min(int(np.searchsorted(self.s, s_hint + window, side="right")), len(self.seg_len))
+        hi = max(hi, lo + 1)
+
+        p0 = self.points[lo:hi]
+        d = self.seg_dir[lo:hi]
+        rel = np.array([x, y]) - p0
+        t = np.clip(np.einsum("ij,ij->i", rel, d), 0.0, self.seg_len[lo:hi])
+        foot = p0 + d * t[:, None]
+        dist2 = np.sum((np.array([x, y]) - foot) ** 2, axis=1)
+        k = int(np.argmin(dist2))
+
+        # CARLA is left-handed (y to the right), so cross > 0 means right of the route
+        cross = d[k, 0] * rel[k, 1] - d[k, 1] * rel[k, 0]
+        return float(self.s[lo + k] + t[k]), float(math.copysign(math.sqrt(dist2[k]), cross))
+
+    def point_at(self, s: float) -> np.ndarray:
+        s = min(max(s, 0.0), self.length)
+        i = min(int(np.searchsorted(self.s, s, side="right")) - 1, len(self.seg_len) - 1)
+        return self.points[i] + self.seg_dir[i] * (s - self.s[i])
+
+
+class PurePursuitTracker:
+    """Pure-pursuit steering and a reference speed along a RouteIndex."""
+
+    MIN_CREEP_SPEED = 0.5  # [m/s]
+
+    def __init__(self, route: RouteIndex, origin=(0.0, 0.0), target_speed: float = 8.0,
+                 lookahead: float = 6.0, lookahead_gain: float = 0.5, wheelbase: float = 2.875,
+                 goal_tolerance: float = 2.0):
+        self.route = route
+        self.origin = np.asarray(origin, dtype=np.float64)
+        self.target_speed = target_speed
+        self.lookahead = lookahead
+        self.lookahead_gain = lookahead_gain
+        self.wheelbase = wheelbase
+        self.goal_tolerance = goal_tolerance
+
+        self.s = 0.0
+        self.done = False
+        self.steps = 0
+        self._cte_abs_sum = 0.0
+        self._cte_sq_sum = 0.0
+        self.cte_max = 0.0
+        self.last_cte = 0.0
+
+    def step(self, x: float, y: float, yaw_deg: float, speed: float):
+        """Return (steer_deg [left: -, right: +], reference speed [m/s]) for the current pose."""
+        px, py = x - self.origin[0], y - self.origin[1]
+        self.s, cte = self.route.project(px, py, s_hint=self.s)
+
+        self.steps += 1
+        self.last_cte = cte
+        self._cte_abs_sum += abs(cte)
+        self._cte_sq_sum += cte * cte
+        self.cte_max = max(self.cte_max, abs(cte))
+
+        if self.route.length - self.s <= self.goal_tolerance:
+            self.done = True
+            return 0.0, 0.0
+
+        ld = self.lookahead + self.lookahead_gain * speed
+        tx, ty = self.route.point_at(self.s + ld)
+        alpha = math.atan2(ty - py, tx - px) - math.radians(yaw_deg)
+        alpha = math.atan2(math.sin(alpha), math.cos(alpha))
+        # yaw grows towards +y (right) in CARLA, so alpha > 0 means the target is to the right
+        steer = math.atan2(2.0 * self.wheelbase * math.sin(alpha), ld)
+
+        # slow down over the last metres; the ramp ends at the route end, not at the
+        # tolerance, and keeps a creep speed so the vehicle does get inside the tolerance
+        v_ref = min(self.target_speed, max(self.route.length - self.s, self.MIN_CREEP_SPEED))
+        return math.degrees(steer), v_ref
+
+    def metrics(self) -> dict:
+        n = max(self.steps, 1)
+        return {
+            "steps": self.steps,
+            "progress": self.s / self.route.length,
+            "cte_mean": self._cte_abs_sum / n,
+            "cte_rms": math.sqrt(self._cte_sq_sum / n),
+            "cte_max": self.cte_max,
+        }
@@ -1,19 +1,12 @@
 #!/usr/bin/env python3
 import sys
 import os
-import glob
+
+from carla_context import CarlaContext  # CARLA 모듈 경로 설정 포함
 
 # ==============================================================================
 # [필수] CARLA Agents 모듈 경로 추가
 # ==============================================================================
-try:
-    sys.path.append(glob.glob('../../../carla/dist/carla-*%d.%d-%s.egg' % (
-        sys.version_info.major,
-        sys.version_info.minor,
-        'win-amd64' if os.name == 'nt' else 'linux-x86_64'))[0])
-except IndexError:
-    pass
-
 current_file_path = os.path.dirname(os.path.abspath(__file__))
 agents_path = os.path.abspath(os.path.join(current_file_path, '../../carla'))
 sys.path.append(agents_path)
@@ -31,23 +24,39 @@ except ImportError:
     print("[ERROR] 'agents' module not found. Please check your CARLA installation path.")
     exit(1)
 
+class _SharedTopologyMap:
+    """carla.Map whose get_topology() returns the topology fetched once through CarlaContext.
+
+    GlobalRoutePlanner calls get_topology() itself; with this the planner and the
+    plot use the same download.
+    """
+
+    def __init__(self, ctx: CarlaContext):
+        self._ctx = ctx
+
+    def get_topology(self):
+        return self._ctx.topology
+
+    def __getattr__(self, name):
+        return getattr(self._ctx.map, name)
+
+
 class DijkstraPathGenerator(Node):
-    def __init__(self):
+    def __init__(self, ctx: CarlaContext = None, plot: bool = True, filename: str = "global_path.csv"):
         super().__init__('dijkstra_path_generator')
-        
+        self.plot = plot
+        self.filename = filename
+        self.file_path = None
+
         try:
-            self.host = '127.0.0.1'
-            self.port = 2000
-            self.client = carla.Client(self.host, self.port)
-            self.client.set_timeout(10.0)
-            self.world = self.client.get_world()
-            self.map = self.world.get_map()
+            self.ctx = ctx if ctx is not None else CarlaContext('127.0.0.1', 2000)
+            self.map = self.ctx.map
             self.get_logger().info("Connected to CARLA.")
         except Exception as e:
             self.get_logger().error(f"Connection Failed: {e}")
             return
 
-        spawn_points = self.map.get_spawn_points()
+        spawn_points = self.ctx.spawn_points
         
         # [설정] 시작점과 도착점
         self.start_tf = spawn_points[0]
@@ -62,7 +71,7 @@ class DijkstraPathGenerator(Node):
     def generate_relative_path(self):
         self.get_logger().info("Calculating Global Route & Converting to Relative Coordinates...")
         
-        grp = GlobalRoutePlanner(self.map, sampling_resolution=1.0)
+        grp = GlobalRoutePlanner(_SharedTopologyMap(self.ctx), sampling_resolution=1.0)
         route = grp.trace_route(self.start_tf.location, self.goal_tf.location)
         
         if not route:
@@ -89,23 +98,23 @@ class DijkstraPathGenerator(Node):
             rel_ry.append(y - start_y)
 
         # 3. CSV 저장 (상대 좌표 저장)
-        filename = "global_path.csv"
-        file_path = os.path.join(os.getcwd(), filename)
+        file_path = os.path.join(os.getcwd(), self.filename)
 
         with open(file_path, "w") as f:
             for x, y in zip(rel_rx, rel_ry):
                 f.write(f"{x},{y}\n") 
         
+        self.file_path = file_path
         self.get_logger().info(f"Relative Path saved to {file_path}")
         self.get_logger().info(f"Path Starts at: ({rel_rx[0]:.1f}, {rel_ry[0]:.1f})")
 
         # 4. 시각화 (전체 맵 포함 + 상대 좌표 기준)
-        if os.environ.get('DISPLAY', '') != '':
+        if self.plot and os.environ.get('DISPLAY', '') != '':
             try:
                 self.get_logger().info("Preparing Visualization...")
                 
                 # [추가] 전체 맵(Topology)도 상대 좌표로 변환해서 그리기
-                topology = self.map.get_topology()
+                topology = self.ctx.topology
                 map_x, map_y = [], []
                 
                 for wp1, wp2 in topology:
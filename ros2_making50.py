@@ -1,65 +1,81 @@
 #!/usr/bin/env python3
-import glob
-import os
-import sys
+import argparse
 import time
 import random
 import logging
 import math
 
-# ==============================================================================
-# CARLA 모듈 경로 설정
-# ==============================================================================
-try:
-    sys.path.append(glob.glob('../../../carla/dist/carla-*%d.%d-%s.egg' % (
-        sys.version_info.major,
-        sys.version_info.minor,
-        'win-amd64' if os.name == 'nt' else 'linux-x86_64'))[0])
-except IndexError:
-    pass
-
+from carla_context import CarlaContext  # CARLA 모듈 경로 설정 포함
+from tick_scheduler import DEADLINE_POLICIES, TickScheduler
 import carla
 from carla import VehicleLightState as vls
 from carla.command import SpawnActor, SetAutopilot, FutureActor, DestroyActor
 
-def main():
-    # ==============================================================================
-    # [설정] 고정 장애물 삭제 & 랜덤 교통량 설정
-    # ==============================================================================
-    
-    # 1. 고정 장애물 리스트를 모두 비웁니다 (삭제)
-    FIXED_VEHICLES = {} 
-    FIXED_CONES = {} 
-    
-    # 2. 목표 총 개수 (전부 움직이는 객체로 채움)
-    TOTAL_VEHICLES_TARGET = 50   
-    TOTAL_WALKERS_TARGET = 50    
-    TM_PORT = 8005    
-    # ==============================================================================
+# ==============================================================================
+# [설정] 고정 장애물 삭제 & 랜덤 교통량 설정
+# ==============================================================================
+
+# 1. 고정 장애물 리스트를 모두 비웁니다 (삭제)
+FIXED_VEHICLES = {}
+FIXED_CONES = {}
+
+# 2. 목표 총 개수 (전부 움직이는 객체로 채움)
+TOTAL_VEHICLES_TARGET = 50
+TOTAL_WALKERS_TARGET = 50
+TM_PORT = 8005
+# ==============================================================================
+
+
+def apply_offset(transform, f_off, r_off):
+    yaw = math.radians(transform.rotation.yaw)
+    fx, fy = math.cos(yaw), math.sin(yaw)
+    rx, ry = math.sin(yaw), -math.cos(yaw)
+    transform.location.x += (fx * f_off) + (rx * r_off)
+    transform.location.y += (fy * f_off) + (ry * r_off)
+    return transform
+
+
+class TrafficSpawner:
+    """Autopilot vehicles and AI walkers on top of a shared CarlaContext."""
+
+    def __init__(self, ctx: CarlaContext, n_vehicles: int = TOTAL_VEHICLES_TARGET,
+                 n_walkers: int = TOTAL_WALKERS_TARGET, tm_port: int = TM_PORT, asynch: bool = False,
+                 hybrid: bool = False, seed: int = None):
+        self.ctx = ctx
+        self.n_vehicles = n_vehicles
+        self.n_walkers = n_walkers
+        self.tm_port = tm_port
+        self.asynch = asynch
+        self.hybrid = hybrid
+        self.seed = seed
+        self.synchronous_master = False
+
+        self.vehicles_list = []
+        self.walkers_list = []
+        self.all_id = []
+        self.all_actors = []
+
+    def setup(self):
+        world = self.ctx.world
+        bp_lib = self.ctx.blueprints
+        spawn_points = self.ctx.spawn_points
+
+        if self.seed is not None:
+            random.seed(self.seed)
+            # walker destinations come from the server's pedestrian RNG
+            world.set_pedestrians_seed(self.seed)
 
-    logging.basicConfig(format='%(levelname)s: %(message)s', level=logging.INFO)
-    client = carla.Client('127.0.0.1', 2000)
-    client.set_timeout(10.0)
-    synchronous_master = False
-
-    vehicles_list = []
-    walkers_list = []
-    all_id = []
-    
-    try:
-        world = client.get_world()
-        bp_lib = world.get_blueprint_library()
-        spawn_points = world.get_map().get_spawn_points()
-        
         # Traffic Manager 설정
-        traffic_manager = client.get_trafficmanager(TM_PORT)
+        traffic_manager = self.ctx.traffic_manager(self.tm_port)
         traffic_manager.set_global_distance_to_leading_vehicle(5.0)
         traffic_manager.global_percentage_speed_difference(50.0)
-        
-        settings = world.get_settings()
-        if settings.synchronous_mode:
-            traffic_manager.set_synchronous_mode(True)
-            synchronous_master = True
+        traffic_manager.set_hybrid_physics_mode(self.hybrid)
+        if self.seed is not None:
+            traffic_manager.set_random_device_seed(self.seed)
+
+        # the TM may be left synchronous by a previous run on the same port
+        self.synchronous_master = self.ctx.synchronous_mode
+        traffic_manager.set_synchronous_mode(self.synchronous_master)
 
         # ------------------------------------------------------------------
         # 1. 고정 장애물 스폰 (리스트가 비어있으므로 실행되지 않음)
@@ -67,14 +83,6 @@ def main():
         print("--- No Fixed Obstacles (Skipped) ---")
         used_indices = [0]
 
-        def apply_offset(transform, f_off, r_off):
-            yaw = math.radians(transform.rotation.yaw)
-            fx, fy = math.cos(yaw), math.sin(yaw)
-            rx, ry = math.sin(yaw), -math.cos(yaw)
-            transform.location.x += (fx * f_off) + (rx * r_off)
-            transform.location.y += (fy * f_off) + (ry * r_off)
-            return transform
-
         def spawn_fixed(targets, filter_pattern, type_name):
             if not targets: return
             blueprints = bp_lib.filter(filter_pattern)
@@ -84,7 +92,7 @@ def main():
             for idx, (f_off, r_off) in targets.items():
                 if idx >= len(spawn_points): continue
                 used_indices.append(idx)
-                
+
                 tf = carla.Transform(spawn_points[idx].location, spawn_points[idx].rotation)
                 tf = apply_offset(tf, f_off, r_off)
                 bp = random.choice(blueprints)
@@ -95,9 +103,9 @@ def main():
                 if actor:
                     actor.set_simulate_physics(True)
                     if type_name == "Vehicle":
-                        actor.set_autopilot(False, TM_PORT)
+                        actor.set_autopilot(False, self.tm_port)
                         actor.apply_control(carla.VehicleControl(hand_brake=True))
-                    vehicles_list.append(actor.id)
+                    self.vehicles_list.append(actor.id)
                     print(f"  [{type_name}] Spawned at Index {idx}")
 
         spawn_fixed(FIXED_VEHICLES, 'vehicle.*', "Vehicle")
@@ -107,9 +115,9 @@ def main():
         # 2. 랜덤 차량 50대 스폰 (Moving Vehicles)
         # ------------------------------------------------------------------
         # 고정 차량이 0대이므로, 50대 전부 랜덤으로 스폰됩니다.
-        n_random_vehicles = TOTAL_VEHICLES_TARGET
+        n_random_vehicles = self.n_vehicles
         print(f"--- Spawning {n_random_vehicles} Random Vehicles ---")
-        
+
         available_spawn_points = [sp for i, sp in enumerate(spawn_points) if i not in used_indices]
         random.shuffle(available_spawn_points)
 
@@ -122,20 +130,20 @@ def main():
             bp = random.choice(vehicle_bps)
             if bp.has_attribute('color'):
                 bp.set_attribute('color', random.choice(bp.get_attribute('color').recommended_values))
-            
+
             bp.set_attribute('role_name', 'autopilot')
-            
+
             # Autopilot ON으로 스폰
             batch.append(SpawnActor(bp, transform)
-                .then(SetAutopilot(FutureActor, True, TM_PORT)))
+                .then(SetAutopilot(FutureActor, True, self.tm_port)))
 
-        for response in client.apply_batch_sync(batch, synchronous_master):
+        for response in self.ctx.client.apply_batch_sync(batch, self.synchronous_master):
             if not response.error:
-                vehicles_list.append(response.actor_id)
+                self.vehicles_list.append(response.actor_id)
 
         # [안전 주행 설정] - 모든 차량이 움직여야 함
         print("Applying Safe-Driving settings...")
-        all_vehicles = world.get_actors(vehicles_list)
+        all_vehicles = world.get_actors(self.vehicles_list)
         for actor in all_vehicles:
             if not actor.attributes.get('role_name') == 'autopilot': continue
             try:
@@ -149,7 +157,7 @@ def main():
                 traffic_manager.ignore_signs_percentage(actor, 0.0)
                 try: traffic_manager.keep_right_rule_percentage(actor, 0.0)
                 except: pass
-                
+
                 # 움직여야 하므로 물리 엔진 켬
                 actor.set_simulate_physics(True)
             except: pass
@@ -157,88 +165,124 @@ def main():
         # ------------------------------------------------------------------
         # 3. 보행자 50명 스폰 (Walkers)
         # ------------------------------------------------------------------
-        print(f"--- Spawning {TOTAL_WALKERS_TARGET} Walkers ---")
-        
+        print(f"--- Spawning {self.n_walkers} Walkers ---")
+
         walker_bps = bp_lib.filter('walker.pedestrian.*')
         controller_bp = bp_lib.find('controller.ai.walker')
-        
+
         spawned_walkers = 0
-        max_retries = TOTAL_WALKERS_TARGET * 2
+        max_retries = self.n_walkers * 2
         retry_count = 0
 
-        while spawned_walkers < TOTAL_WALKERS_TARGET and retry_count < max_retries:
+        while spawned_walkers < self.n_walkers and retry_count < max_retries:
             loc = world.get_random_location_from_navigation()
             if loc:
                 spawn_transform = carla.Transform(loc)
                 walker_bp = random.choice(walker_bps)
                 if walker_bp.has_attribute('is_invincible'):
                     walker_bp.set_attribute('is_invincible', 'false')
-                
+
                 walker = world.try_spawn_actor(walker_bp, spawn_transform)
                 if walker:
                     controller = world.try_spawn_actor(controller_bp, carla.Transform(), walker)
                     if controller:
-                        walkers_list.append({"id": walker.id, "con": controller.id})
+                        self.walkers_list.append({"id": walker.id, "con": controller.id})
                         spawned_walkers += 1
                     else:
                         walker.destroy()
-                
+
             retry_count += 1
 
-        for item in walkers_list:
-            all_id.append(item["con"])
-            all_id.append(item["id"])
+        for item in self.walkers_list:
+            self.all_id.append(item["con"])
+            self.all_id.append(item["id"])
 
-        all_actors = world.get_actors(all_id)
-        
-        if not args.asynch and synchronous_master:
-            world.tick()
-        else:
-            world.wait_for_tick()
+        self.all_actors = world.get_actors(self.all_id)
+
+        self.tick()
 
         # 걷기 시작
         world.set_pedestrians_cross_factor(0.0)
-        for i in range(0, len(all_id), 2):
-            all_actors[i].start()
-            all_actors[i].go_to_location(world.get_random_location_from_navigation())
-            all_actors[i].set_max_speed(1.4)
+        for i in range(0, len(self.all_id), 2):
+            self.all_actors[i].start()
+            self.all_actors[i].go_to_location(world.get_random_location_from_navigation())
+            self.all_actors[i].set_max_speed(1.4)
 
-        print(f"Done. (Vehicles: {len(vehicles_list)}, Walkers: {len(walkers_list)})")
+        print(f"Done. (Vehicles: {len(self.vehicles_list)}, Walkers: {len(self.walkers_list)})")
+
+    def tick(self):
+        if not self.asynch and self.synchronous_master:
+            self.ctx.world.tick()
+        else:
+            self.ctx.world.wait_for_tick()
+
+    def destroy(self):
+        client = self.ctx.client
+        client.apply_batch([DestroyActor(x) for x in self.vehicles_list])
+        for i in range(0, len(self.all_id), 2):
+            self.all_actors[i].stop()
+        client.apply_batch([DestroyActor(x) for x in self.all_id])
+        self.vehicles_list = []
+        self.all_id = []
+
+
+def main(args):
+    logging.basicConfig(format='%(levelname)s: %(message)s', level=logging.INFO)
+    ctx = CarlaContext(args.host, args.port)
+    traffic = TrafficSpawner(ctx, n_vehicles=args.vehicles, n_walkers=args.walkers, tm_port=args.tm_port,
+                             asynch=args.asynch, hybrid=args.hybrid, seed=args.seed)
+
+    try:
+        traffic.setup()
         print("Press Ctrl+C to exit and destroy actors.")
 
         # ------------------------------------------------------------------
         # 4. 루프 유지
         # ------------------------------------------------------------------
-        while True:
-            if not args.asynch and synchronous_master:
-                world.tick()
-            else:
-                world.wait_for_tick()
+        # synchronous master: ticks at --rate; otherwise wait_for_tick() follows the server
+        rate = args.rate if traffic.synchronous_master and not args.asynch else 0.0
+        TickScheduler(traffic.tick, rate_hz=rate, deadline_policy=args.deadline).run()
 
     except KeyboardInterrupt:
         print('\nCancelled by user. Destroying actors...')
     finally:
-        if synchronous_master:
-            settings = world.get_settings()
+        if traffic.synchronous_master:
+            settings = ctx.world.get_settings()
             settings.synchronous_mode = False
             settings.fixed_delta_seconds = None
-            world.apply_settings(settings)
+            ctx.world.apply_settings(settings)
+
+        traffic.destroy()
 
-        client.apply_batch([DestroyActor(x) for x in vehicles_list])
-        for i in range(0, len(all_id), 2):
-            all_actors[i].stop()
-        client.apply_batch([DestroyActor(x) for x in all_id])
-        
         time.sleep(0.5)
         print('Cleanup done.')
 
 if __name__ == '__main__':
-    class Args:
-        asynch = False
-    args = Args()
-    
+    argparser = argparse.ArgumentParser(description='Spawn autopilot traffic and walkers')
+    argparser.add_argument('--host', metavar='H', default='127.0.0.1',
+                           help='IP of the host CARLA Simulator (default: 127.0.0.1)')
+    argparser.add_argument('--port', metavar='P', default=2000, type=int,
+                           help='TCP port of CARLA Simulator (default: 2000)')
+    argparser.add_argument('-n', '--vehicles', default=TOTAL_VEHICLES_TARGET, type=int,
+                           help=f'number of autopilot vehicles (default: {TOTAL_VEHICLES_TARGET})')
+    argparser.add_argument('-w', '--walkers', default=TOTAL_WALKERS_TARGET, type=int,
+                           help=f'number of walkers (default: {TOTAL_WALKERS_TARGET})')
+    argparser.add_argument('--tm-port', default=TM_PORT, type=int,
+                           help=f'Traffic Manager port (default: {TM_PORT})')
+    argparser.add_argument('--asynch', action='store_true',
+                           help='wait for server ticks instead of ticking, even if the world is synchronous')
+    argparser.add_argument('--hybrid', action='store_true',
+                           help='enable Traffic Manager hybrid physics mode')
+    argparser.add_argument('--rate', metavar='HZ', default=0.0, type=float,
+                           help='tick rate when this script is the synchronous master, 0 = as fast as possible')
+    argparser.add_argument('--deadline', choices=DEADLINE_POLICIES, default='skip',
+                           help='what to do when a tick overruns its slot (default: skip)')
+    argparser.add_argument('-s', '--seed', default=None, type=int,
+                           help='random seed for spawn choices and the Traffic Manager')
+    args = argparser.parse_args()
+
     try:
-        main()
+        main(args)
     except KeyboardInterrupt:
         pass
     finally:
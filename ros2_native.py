@@ -3,56 +3,228 @@
 import argparse
 import json
 import logging
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
 import numpy as np
 import carla
 import cv2
+from carla.command import SpawnActor, DestroyActor
 
 import rclpy
+from rclpy.callback_groups import MutuallyExclusiveCallbackGroup
+from rclpy.executors import MultiThreadedExecutor
 from rclpy.node import Node
 from sensor_msgs.msg import Image as RosImage
+from sensor_msgs.msg import CompressedImage
+from std_msgs.msg import String
+from diagnostic_msgs.msg import DiagnosticArray, DiagnosticStatus, KeyValue
 from cv_bridge import CvBridge
 from geometry_msgs.msg import Twist
 
+from carla_context import BlueprintIndex, CarlaContext
+from shm_transport import ShmFrameWriter
+from path_tracker import RouteIndex, PurePursuitTracker, load_route_csv
+from tick_scheduler import DEADLINE_POLICIES, TickScheduler
+from load_governor import PRIORITIES, LoadGovernor, StreamLoad
+
+
+# Colour conversion applied before publishing (same as the colorizers below)
+COLOR_CONVERTERS = {
+    "sensor.camera.depth": carla.ColorConverter.LogarithmicDepth,
+    "sensor.camera.semantic_segmentation": carla.ColorConverter.CityScapesPalette,
+}
+
+# "format" in the JSON config -> (cv2 extension, CompressedImage.format)
+COMPRESSED_FORMATS = {
+    "jpeg": (".jpg", "bgr8; jpeg compressed bgr8"),
+    "png": (".png", "bgr8; png compressed bgr8"),
+}
+
+# "quality" per format -> (cv2 flag, default, min, max); for png it is the zlib level, low is fast
+COMPRESSED_QUALITY = {
+    "jpeg": (cv2.IMWRITE_JPEG_QUALITY, 90, 0, 100),
+    "png": (cv2.IMWRITE_PNG_COMPRESSION, 1, 0, 9),
+}
+
+
+def _bgra_to_bgr(image: carla.Image):
+    arr = np.frombuffer(image.raw_data, dtype=np.uint8)
+    return arr.reshape((image.height, image.width, 4))[:, :, :3]
+
+
+def _downscale(arr, scale: float):
+    if scale >= 1.0:
+        return arr
+    return cv2.resize(arr, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
 
 class DepthColorizer:
     """Convert depth image to colored image and publish as ROS Image."""
 
-    def __init__(self, node: Node, topic: str):
+    def __init__(self, node: Node, topic: str, frame_id: str = "camera_depth", load: StreamLoad = None):
         self.node = node
+        self.frame_id = frame_id
+        self.load = load
         self.bridge = CvBridge()
         self.pub = node.create_publisher(RosImage, topic, 10)
         self.node.get_logger().info(f"[DepthColorizer] publish -> {topic}")
 
     def handle(self, image: carla.Image):
         image.convert(carla.ColorConverter.LogarithmicDepth)
-        arr = np.frombuffer(image.raw_data, dtype=np.uint8)
-        arr = arr.reshape((image.height, image.width, 4))[:, :, :3]
+        arr = _downscale(_bgra_to_bgr(image), self.load.scale if self.load else 1.0)
         msg = self.bridge.cv2_to_imgmsg(arr, encoding="bgr8")
         msg.header.stamp = self.node.get_clock().now().to_msg()
-        msg.header.frame_id = "camera_depth"
+        msg.header.frame_id = self.frame_id
         self.pub.publish(msg)
 
 
 class SemanticColorizer:
     """Convert semantic segmentation image to colored image and publish as ROS Image."""
 
-    def __init__(self, node: Node, topic: str):
+    def __init__(self, node: Node, topic: str, frame_id: str = "camera_semantic", load: StreamLoad = None):
         self.node = node
+        self.frame_id = frame_id
+        self.load = load
         self.bridge = CvBridge()
         self.pub = node.create_publisher(RosImage, topic, 10)
         self.node.get_logger().info(f"[SemanticColorizer] publish -> {topic}")
 
     def handle(self, image: carla.Image):
         image.convert(carla.ColorConverter.CityScapesPalette)
-        arr = np.frombuffer(image.raw_data, dtype=np.uint8)
-        arr = arr.reshape((image.height, image.width, 4))[:, :, :3]
+        arr = _downscale(_bgra_to_bgr(image), self.load.scale if self.load else 1.0)
         msg = self.bridge.cv2_to_imgmsg(arr, encoding="bgr8")
         msg.header.stamp = self.node.get_clock().now().to_msg()
-        msg.header.frame_id = "camera_semantic"
+        msg.header.frame_id = self.frame_id
         self.pub.publish(msg)
 
 
+class CompressedPublisher:
+    """Encode camera images in a worker pool and publish as ROS CompressedImage.
+
+    cv2.imencode releases the GIL, so encoding runs in parallel across cores while
+    the sensor callback only hands the frame over. At most `max_pending` frames per
+    stream are in flight; newer frames are dropped instead of queueing up.
+    `compressed` is a sensor's "compressed" entry, already validated by _parse_compressed.
+    """
+
+    def __init__(self, node: Node, topic: str, frame_id: str, pool: ThreadPoolExecutor,
+                 compressed: dict, converter=None, load: StreamLoad = None):
+        self.node = node
+        self.frame_id = frame_id
+        self.pool = pool
+        self.scale = compressed["scale"]
+        self.converter = converter
+        self.load = load
+        self.ext, self.format = COMPRESSED_FORMATS[compressed["format"]]
+        self.params = compressed["params"]
+        self.dropped = 0
+        self.max_pending = compressed["max_pending"]
+        self.pending = 0
+        self._pending_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self.pub = node.create_publisher(CompressedImage, topic, 10)
+        self.node.get_logger().info(
+            f"[CompressedPublisher] publish -> {topic} "
+            f"({compressed['format']}, q={compressed['quality']}, scale={self.scale})")
+
+    def handle(self, image: carla.Image):
+        if not self._slots.acquire(blocking=False):
+            self.dropped += 1
+            return
+        stamp = self.node.get_clock().now().to_msg()
+        with self._pending_lock:
+            self.pending += 1
+        try:
+            self.pool.submit(self._encode, image, stamp)
+        except RuntimeError:
+            # pool already shut down
+            with self._pending_lock:
+                self.pending -= 1
+            self._slots.release()
+
+    def queue_depth(self):
+        return self.pending, self.max_pending
+
+    def _encode(self, image: carla.Image, stamp):
+        t0 = time.monotonic()
+        try:
+            if self.converter is not None:
+                image.convert(self.converter)
+            scale = self.scale * (self.load.scale if self.load else 1.0)
+            arr = _downscale(_bgra_to_bgr(image), scale)
+            ok, buf = cv2.imencode(self.ext, np.ascontiguousarray(arr), self.params)
+            if not ok:
+                self.node.get_logger().warn(f"[CompressedPublisher] encoding failed for {self.frame_id}")
+                return
+
+            msg = CompressedImage()
+            msg.header.stamp = stamp
+            msg.header.frame_id = self.frame_id
+            msg.format = self.format
+            msg.data.frombytes(buf.tobytes())
+            self.pub.publish(msg)
+        except Exception as e:
+            self.node.get_logger().error(f"[CompressedPublisher] {self.frame_id}: {e}")
+        finally:
+            if self.load is not None:
+                # the frame was already counted by the sensor callback
+                self.load.record(time.monotonic() - t0, frame=False)
+            with self._pending_lock:
+                self.pending -= 1
+            self._slots.release()
+
+
+class ShmPublisher:
+    """Write camera images into a shared-memory ring and publish a small descriptor.
+
+    Local readers map the slot with shm_transport.ShmFrameReader instead of
+    receiving the pixels through DDS.
+    """
+
+    def __init__(self, node: Node, topic: str, shm_name: str, frame_id: str,
+                 slots: int = 4, converter=None):
+        self.node = node
+        self.shm_name = shm_name
+        self.frame_id = frame_id
+        self.slots = slots
+        self.converter = converter
+        self.writer = None
+        self.closed = False
+        # close() must not run while a callback writes into the ring
+        self._lock = threading.Lock()
+        self.pub = node.create_publisher(String, topic, 10)
+        self.node.get_logger().info(f"[ShmPublisher] publish -> {topic} (shm '{shm_name}', {slots} slots)")
+
+    def handle(self, image: carla.Image):
+        if self.converter is not None:
+            image.convert(self.converter)
+        arr = _bgra_to_bgr(image)
+        with self._lock:
+            if self.closed:
+                return
+            if self.writer is None:
+                # the ring is sized from the first frame
+                self.writer = ShmFrameWriter(self.shm_name, arr.shape, slots=self.slots)
+            slot = self.writer.write(arr, image.frame)
+            stamp = self.node.get_clock().now().to_msg()
+            desc = self.writer.descriptor(slot, image.frame, stamp, frame_id=self.frame_id)
+
+        self.pub.publish(String(data=desc))
+
+    def close(self):
+        with self._lock:
+            self.closed = True
+            if self.writer is not None:
+                self.writer.close()
+                self.writer = None
+
+
 def show_spectator(image: carla.Image):
     """Show spectator camera with OpenCV (800x600)."""
     pass  # 아무것도 하지 않음 (창 안 띄움)
@@ -63,192 +235,772 @@ def show_spectator(image: carla.Image):
     # cv2.waitKey(1)
 
 
-def _setup_vehicle(world, config):
-    logging.debug("Spawning vehicle: {}".format(config.get("type")))
+SPAWN_POINT_KEYS = ("x", "y", "z", "roll", "pitch", "yaw")
+
+
+@dataclass(frozen=True)
+class SpawnPoint:
+    """Sensor mounting pose in ROS convention (right-handed, y left)."""
+    x: float
+    y: float
+    z: float
+    roll: float
+    pitch: float
+    yaw: float
+
+    def to_transform(self) -> carla.Transform:
+        # CARLA is left-handed: flip y, pitch and yaw
+        return carla.Transform(
+            location=carla.Location(x=self.x, y=-self.y, z=self.z),
+            rotation=carla.Rotation(roll=self.roll, pitch=-self.pitch, yaw=-self.yaw)
+        )
+
+
+@dataclass
+class SensorSpec:
+    type: str
+    id: str
+    spawn_point: SpawnPoint
+    attributes: Dict[str, str] = field(default_factory=dict)
+    compressed: Optional[dict] = None
+    shm: Optional[dict] = None
+    load: dict = field(default_factory=lambda: dict(LOAD_DEFAULTS))
 
-    bp_library = world.get_blueprint_library()
-    map_ = world.get_map()
 
-    bp = bp_library.filter(config.get("type"))[0]
-    bp.set_attribute("role_name", config.get("id"))
-    bp.set_attribute("ros_name", config.get("id"))
+@dataclass
+class VehicleSpec:
+    type: str
+    id: str
+    sensors: List[SensorSpec] = field(default_factory=list)
+    spawn_index: int = 0
+    tracker: Optional[dict] = None
 
-    return world.spawn_actor(
-        bp,
-        map_.get_spawn_points()[0],
-        attach_to=None
+
+def _require_str(entry: dict, key: str, where: str) -> str:
+    value = entry.get(key)
+    if not isinstance(value, str) or not value:
+        raise ValueError(f"{where}: '{key}' must be a non-empty string")
+    return value
+
+
+def _parse_spawn_point(entry, where: str) -> SpawnPoint:
+    if not isinstance(entry, dict):
+        raise ValueError(f"{where}: must be an object with keys {', '.join(SPAWN_POINT_KEYS)}")
+    missing = [k for k in SPAWN_POINT_KEYS if k not in entry]
+    if missing:
+        raise ValueError(f"{where}: missing {', '.join(missing)}")
+    try:
+        return SpawnPoint(**{k: float(entry[k]) for k in SPAWN_POINT_KEYS})
+    except (TypeError, ValueError):
+        raise ValueError(f"{where}: values must be numbers, got {entry}") from None
+
+
+def _parse_compressed(entry, sensor_type: str, where: str) -> Optional[dict]:
+    if entry is None:
+        return None
+    if not sensor_type.startswith("sensor.camera."):
+        raise ValueError(f"{where}: only supported on cameras")
+    if not isinstance(entry, dict):
+        raise ValueError(f"{where}: must be an object")
+    fmt = entry.get("format", "jpeg")
+    if fmt not in COMPRESSED_FORMATS:
+        raise ValueError(f"{where}.format: use one of {sorted(COMPRESSED_FORMATS)}")
+    flag, default_quality, q_min, q_max = COMPRESSED_QUALITY[fmt]
+    compressed = {
+        "format": fmt,
+        "quality": entry.get("quality", default_quality),
+        "scale": entry.get("scale", 1.0),
+        "max_pending": entry.get("max_pending", 2),
+    }
+    try:
+        compressed["quality"] = int(compressed["quality"])
+        compressed["scale"] = float(compressed["scale"])
+        compressed["max_pending"] = int(compressed["max_pending"])
+    except (TypeError, ValueError):
+        raise ValueError(f"{where}: quality/scale/max_pending must be numbers") from None
+    if not q_min <= compressed["quality"] <= q_max:
+        raise ValueError(f"{where}.quality: must be in [{q_min}, {q_max}] for {fmt}")
+    if not 0.0 < compressed["scale"] <= 1.0:
+        raise ValueError(f"{where}.scale: must be in (0, 1]")
+    if compressed["max_pending"] < 1:
+        raise ValueError(f"{where}.max_pending: must be >= 1")
+    compressed["params"] = [int(flag), compressed["quality"]]
+    return compressed
+
+
+def _parse_shm(entry, sensor_type: str, where: str) -> Optional[dict]:
+    if entry is None or entry is False:
+        return None
+    if not sensor_type.startswith("sensor.camera."):
+        raise ValueError(f"{where}: only supported on cameras")
+    if entry is True:
+        entry = {}
+    if not isinstance(entry, dict):
+        raise ValueError(f"{where}: must be true or an object")
+    try:
+        slots = int(entry.get("slots", 4))
+    except (TypeError, ValueError):
+        raise ValueError(f"{where}.slots: must be an integer") from None
+    if slots < 2:
+        raise ValueError(f"{where}.slots: must be >= 2")
+    # false: shm only, no sensor_msgs/Image (CARLA's native one and the colorized one)
+    ros_image = entry.get("ros_image", True)
+    if not isinstance(ros_image, bool):
+        raise ValueError(f"{where}.ros_image: must be true or false")
+    return {"slots": slots, "ros_image": ros_image}
+
+
+TRACKER_DEFAULTS = {
+    "target_speed": 8.0,      # [m/s]
+    "lookahead": 6.0,         # [m] at standstill
+    "lookahead_gain": 0.5,    # [s] extra lookahead per m/s
+    "wheelbase": 2.875,       # [m] Model 3
+    "goal_tolerance": 2.0,    # [m]
+    "log_every": 100,         # [ticks] tracking-error report period
+}
+
+
+def _parse_tracker(entry, where: str) -> Optional[dict]:
+    if entry is None:
+        return None
+    if not isinstance(entry, dict):
+        raise ValueError(f"{where}: must be an object")
+    route = _require_str(entry, "route", where)
+    tracker = dict(TRACKER_DEFAULTS)
+    try:
+        for key in TRACKER_DEFAULTS:
+            tracker[key] = float(entry.get(key, TRACKER_DEFAULTS[key]))
+        tracker["log_every"] = int(tracker["log_every"])
+        # route CSV is relative to its first point; by default that is where the vehicle spawns
+        origin = entry.get("origin")
+        tracker["origin"] = None if origin is None else (float(origin[0]), float(origin[1]))
+    except (TypeError, ValueError, IndexError):
+        raise ValueError(f"{where}: numeric fields must be numbers, origin must be [x, y]") from None
+    for key in ("target_speed", "lookahead", "wheelbase"):
+        if tracker[key] <= 0.0:
+            raise ValueError(f"{where}.{key}: must be > 0")
+    for key in ("lookahead_gain", "goal_tolerance"):
+        if tracker[key] < 0.0:
+            raise ValueError(f"{where}.{key}: must be >= 0")
+    if tracker["log_every"] < 1:
+        raise ValueError(f"{where}.log_every: must be >= 1")
+    try:
+        tracker["points"] = load_route_csv(route)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"{where}.route: {e}") from None
+    tracker["route"] = route
+    return tracker
+
+
+# priority and degradation bounds; the defaults keep a stream at full rate and size
+LOAD_DEFAULTS = {"priority": "normal", "max_decimation": 1, "min_scale": 1.0}
+
+
+def _parse_load(entry, has_output: bool, where: str) -> dict:
+    if entry is None:
+        return dict(LOAD_DEFAULTS)
+    if not isinstance(entry, dict):
+        raise ValueError(f"{where}: must be an object")
+    # the governor only sheds the bridge's own outputs; CARLA's native topics are not touched
+    if not has_output:
+        raise ValueError(f"{where}: needs a colorized, compressed or shm output on this sensor")
+    unknown = sorted(set(entry) - set(LOAD_DEFAULTS))
+    if unknown:
+        raise ValueError(f"{where}: unknown key(s) {', '.join(unknown)} (use {', '.join(LOAD_DEFAULTS)})")
+    load = dict(LOAD_DEFAULTS)
+    load.update(entry)
+    if not isinstance(load["priority"], str) or load["priority"] not in PRIORITIES:
+        raise ValueError(f"{where}.priority: use one of {', '.join(PRIORITIES)}")
+    try:
+        load["max_decimation"] = int(load["max_decimation"])
+        load["min_scale"] = float(load["min_scale"])
+    except (TypeError, ValueError):
+        raise ValueError(f"{where}: max_decimation/min_scale must be numbers") from None
+    if load["max_decimation"] < 1:
+        raise ValueError(f"{where}.max_decimation: must be >= 1")
+    if not 0.0 < load["min_scale"] <= 1.0:
+        raise ValueError(f"{where}.min_scale: must be in (0, 1]")
+    return load
+
+
+def parse_vehicle_config(config, where: str = "config") -> VehicleSpec:
+    """Validate a vehicle rig config (see tesla.json) before anything is spawned."""
+    if not isinstance(config, dict):
+        raise ValueError(f"{where}: must be an object")
+
+    spec = VehicleSpec(
+        type=_require_str(config, "type", where),
+        id=_require_str(config, "id", where),
     )
+    try:
+        spec.spawn_index = int(config.get("spawn_index", 0))
+    except (TypeError, ValueError):
+        raise ValueError(f"{where}.spawn_index: must be an integer") from None
+
+    spec.tracker = _parse_tracker(config.get("tracker"), f"{where}.tracker")
+
+    sensors = config.get("sensors", [])
+    if not isinstance(sensors, list):
+        raise ValueError(f"{where}.sensors: must be a list")
+
+    seen = set()
+    for i, sensor in enumerate(sensors):
+        s_where = f"{where}.sensors[{i}]"
+        if not isinstance(sensor, dict):
+            raise ValueError(f"{s_where}: must be an object")
+        sensor_type = _require_str(sensor, "type", s_where)
+        sensor_id = _require_str(sensor, "id", s_where)
+        if sensor_id in seen:
+            raise ValueError(f"{s_where}: duplicate sensor id '{sensor_id}'")
+        seen.add(sensor_id)
+
+        attributes = sensor.get("attributes", {})
+        if not isinstance(attributes, dict):
+            raise ValueError(f"{s_where}.attributes: must be an object")
+
+        compressed = _parse_compressed(sensor.get("compressed"), sensor_type, f"{s_where}.compressed")
+        shm = _parse_shm(sensor.get("shm"), sensor_type, f"{s_where}.shm")
+        has_output = bool(compressed or shm or sensor_type in COLOR_CONVERTERS)
+        spec.sensors.append(SensorSpec(
+            type=sensor_type,
+            id=sensor_id,
+            spawn_point=_parse_spawn_point(sensor.get("spawn_point"), f"{s_where}.spawn_point"),
+            attributes={str(k): str(v) for k, v in attributes.items()},
+            compressed=compressed,
+            shm=shm,
+            load=_parse_load(sensor.get("load"), has_output, f"{s_where}.load"),
+        ))
+
+    return spec
+
+
+def parse_rig_config(config) -> List[VehicleSpec]:
+    """Validate one vehicle config, a list of them, or {"vehicles": [...]}.
+
+    Vehicles without an explicit spawn_index get their position in the list.
+    """
+    if isinstance(config, dict) and "vehicles" in config:
+        config = config["vehicles"]
+        where = "config.vehicles"
+    elif isinstance(config, dict):
+        config = [config]
+        where = "config"
+    else:
+        where = "config"
+    if not isinstance(config, list) or not config:
+        raise ValueError(f"{where}: must be a vehicle object or a non-empty list of them")
+
+    specs = []
+    for i, entry in enumerate(config):
+        v_where = where if where == "config" and len(config) == 1 else f"{where}[{i}]"
+        spec = parse_vehicle_config(entry, v_where)
+        if isinstance(entry, dict) and "spawn_index" not in entry:
+            spec.spawn_index = i
+        # the generator starts its route at spawn point 0; anchoring it at another
+        # spawn point would put it on the wrong roads
+        if spec.tracker is not None and spec.tracker["origin"] is None and spec.spawn_index != 0:
+            raise ValueError(f"{v_where}.tracker.origin: required when spawn_index is not 0 "
+                             f"(spawn_index {spec.spawn_index})")
+        specs.append(spec)
+
+    ids = [spec.id for spec in specs]
+    duplicates = sorted({x for x in ids if ids.count(x) > 1})
+    if duplicates:
+        raise ValueError(f"{where}: duplicate vehicle id(s) {', '.join(duplicates)}")
+    indices = [spec.spawn_index for spec in specs]
+    duplicates = sorted({x for x in indices if indices.count(x) > 1})
+    if duplicates:
+        raise ValueError(f"{where}: several vehicles share spawn_index {', '.join(map(str, duplicates))}")
+    return specs
+
+
+def spawn_rigs(client, world, specs: List[VehicleSpec], blueprints: BlueprintIndex, spawn_points):
+    """Spawn all vehicles in one batch, then all of their sensors in a second one.
+
+    Every blueprint is resolved before anything is spawned. If any command fails
+    the actors spawned so far are destroyed again and the error is re-raised.
+    Returns one (vehicle, sensors) pair per spec, sensors in the order of spec.sensors.
+    """
+    for spec in specs:
+        if not 0 <= spec.spawn_index < len(spawn_points):
+            raise ValueError(f"{spec.id}: spawn_index {spec.spawn_index} out of range (map has {len(spawn_points)})")
+
+    vehicle_bps = []
+    sensor_bps = []
+    for spec in specs:
+        bp = blueprints.make(spec.type)
+        bp.set_attribute("role_name", spec.id)
+        bp.set_attribute("ros_name", spec.id)
+        vehicle_bps.append(bp)
+        for sensor in spec.sensors:
+            bp = blueprints.make(sensor.type)
+            bp.set_attribute("ros_name", sensor.id)
+            bp.set_attribute("role_name", sensor.id)
+            for key, value in sensor.attributes.items():
+                bp.set_attribute(key, value)
+            sensor_bps.append(bp)
+
+    spawned = []
+    try:
+        logging.debug("Spawning {} vehicles".format(len(specs)))
+        batch = [SpawnActor(bp, spawn_points[spec.spawn_index]) for bp, spec in zip(vehicle_bps, specs)]
+        errors = []
+        vehicle_ids = []
+        for spec, response in zip(specs, client.apply_batch_sync(batch, False)):
+            if response.error:
+                errors.append(f"{spec.id} ({spec.type}): {response.error}")
+            else:
+                spawned.append(response.actor_id)
+                vehicle_ids.append(response.actor_id)
+        if errors:
+            raise RuntimeError(f"failed to spawn vehicles: {'; '.join(errors)}")
+
+        logging.debug("Spawning {} sensors".format(len(sensor_bps)))
+        batch = []
+        owners = []
+        bp_iter = iter(sensor_bps)
+        for spec, vehicle_id in zip(specs, vehicle_ids):
+            for sensor in spec.sensors:
+                batch.append(SpawnActor(next(bp_iter), sensor.spawn_point.to_transform(), vehicle_id))
+                owners.append(f"{spec.id}/{sensor.id}")
+        sensor_ids = []
+        for owner, response in zip(owners, client.apply_batch_sync(batch, True)):
+            if response.error:
+                errors.append(f"{owner}: {response.error}")
+            else:
+                spawned.append(response.actor_id)
+                sensor_ids.append(response.actor_id)
+        if errors:
+            raise RuntimeError(f"failed to spawn sensors: {'; '.join(errors)}")
+
+        actors = world.get_actors(spawned)
+        rigs = []
+        id_iter = iter(sensor_ids)
+        for spec, vehicle_id in zip(specs, vehicle_ids):
+            vehicle = actors.find(vehicle_id)
+            sensors = [actors.find(next(id_iter)) for _ in spec.sensors]
+            if vehicle is None or any(a is None for a in sensors):
+                raise RuntimeError(f"{spec.id}: spawned actors not found in world")
+            rigs.append((vehicle, sensors))
+        return rigs
+
+    except Exception:
+        if spawned:
+            logging.warning("Rolling back {} spawned actors".format(len(spawned)))
+            client.apply_batch_sync([DestroyActor(x) for x in reversed(spawned)], False)
+        raise
+
+
+class SensorStream:
+    """One sensor: its listen() handler chain and load state.
+
+    Decimation and scaling only apply to the bridge's own outputs; CARLA's native
+    ROS publisher keeps the sensor_tick rate.
+    """
+
+    def __init__(self, actor, spec: SensorSpec, load: StreamLoad):
+        self.actor = actor
+        self.spec = spec
+        self.load = load
+        self.handlers = []
+
+    def dispatch(self, image):
+        if not self.load.admit():
+            return
+        t0 = time.monotonic()
+        for h in self.handlers:
+            h(image)
+        self.load.record(time.monotonic() - t0)
 
 
 def _setup_sensors(
-    world,
-    vehicle,
-    sensors_config,
-    depth_colorizer: DepthColorizer = None,
-    semantic_colorizer: SemanticColorizer = None,
+    node: Node,
+    sensor_actors,
+    sensor_specs: List[SensorSpec],
+    ros_prefix: str,
+    encode_pool: ThreadPoolExecutor = None,
+    shm_prefix: str = "carla_hero",
+    governor: LoadGovernor = None,
 ):
-    bp_library = world.get_blueprint_library()
-
-    sensors = []
-    for sensor in sensors_config:
-        logging.debug("Spawning sensor: {}".format(sensor))
-
-        bp = bp_library.filter(sensor.get("type"))[0]
-        bp.set_attribute("ros_name", sensor.get("id"))
-        bp.set_attribute("role_name", sensor.get("id"))
-        for key, value in sensor.get("attributes", {}).items():
-            bp.set_attribute(str(key), str(value))
-
-        wp = carla.Transform(
-            location=carla.Location(
-                x=sensor["spawn_point"]["x"],
-                y=-sensor["spawn_point"]["y"],
-                z=sensor["spawn_point"]["z"]
-            ),
-            rotation=carla.Rotation(
-                roll=sensor["spawn_point"]["roll"],
-                pitch=-sensor["spawn_point"]["pitch"],
-                yaw=-sensor["spawn_point"]["yaw"]
-            )
+    """Attach the ROS outputs to every sensor.
+
+    Returns the SensorStreams and the handlers that need close().
+    """
+    vehicle_id = ros_prefix.rsplit("/", 1)[-1]
+    streams = []
+    closables = []
+    for actor, sensor in zip(sensor_actors, sensor_specs):
+        # shm-only cameras skip every sensor_msgs/Image output, native and colorized
+        ros_image = not sensor.shm or sensor.shm["ros_image"]
+        if ros_image:
+            actor.enable_for_ros()
+        # one frame_id for every output of this sensor, unique across vehicles
+        frame_id = "{}/{}".format(vehicle_id, sensor.id)
+
+        load = StreamLoad(
+            frame_id,
+            priority=sensor.load["priority"],
+            max_decimation=sensor.load["max_decimation"],
+            min_scale=sensor.load["min_scale"],
+            can_scale=sensor.type.startswith("sensor.camera."),
         )
+        stream = SensorStream(actor, sensor, load)
+        streams.append(stream)
+
+        # a sensor has a single listen() callback, so chain every handler of this sensor
+        handlers = stream.handlers
+        # set once a synchronous handler converted the image in place, don't convert twice
+        converted = False
+        if ros_image and sensor.type == "sensor.camera.depth":
+            colorizer = DepthColorizer(node, "{}/{}/image_depth".format(ros_prefix, sensor.id), frame_id, load=load)
+            handlers.append(colorizer.handle)
+            converted = True
+
+        if ros_image and sensor.type == "sensor.camera.semantic_segmentation":
+            colorizer = SemanticColorizer(node, "{}/{}/image_color".format(ros_prefix, sensor.id), frame_id, load=load)
+            handlers.append(colorizer.handle)
+            converted = True
+
+        if sensor.id == "spectator" and sensor.type.startswith("sensor.camera.rgb"):
+            handlers.append(show_spectator)
+
+        if sensor.shm:
+            shm_pub = ShmPublisher(
+                node,
+                "{}/{}/image/shm".format(ros_prefix, sensor.id),
+                "{}_{}".format(shm_prefix, sensor.id),
+                frame_id,
+                slots=sensor.shm["slots"],
+                converter=None if converted else COLOR_CONVERTERS.get(sensor.type),
+            )
+            handlers.append(shm_pub.handle)
+            closables.append(shm_pub)
+            converted = converted or sensor.type in COLOR_CONVERTERS
+
+        if sensor.compressed and encode_pool is not None:
+            converter = None if converted else COLOR_CONVERTERS.get(sensor.type)
+            compressor = CompressedPublisher(
+                node,
+                "{}/{}/image/compressed".format(ros_prefix, sensor.id),
+                frame_id,
+                encode_pool,
+                sensor.compressed,
+                converter=converter,
+                load=load,
+            )
+            handlers.append(compressor.handle)
+            load.queue_fn = compressor.queue_depth
+            load.dropped_fn = lambda c=compressor: c.dropped
 
-        actor = world.spawn_actor(bp, wp, attach_to=vehicle)
-        actor.enable_for_ros()
-
-        if depth_colorizer is not None and sensor.get("type") == "sensor.camera.depth":
-            actor.listen(lambda img, dc=depth_colorizer: dc.handle(img))
+        if handlers:
+            actor.listen(stream.dispatch)
+            # a sensor without bridge outputs has nothing the governor could shed
+            if governor is not None:
+                governor.add(load)
 
-        if semantic_colorizer is not None and sensor.get("type") == "sensor.camera.semantic_segmentation":
-            actor.listen(lambda img, sc=semantic_colorizer: sc.handle(img))
+    return streams, closables
 
-        if sensor.get("id") == "spectator" and sensor.get("id") != "camera_front" and sensor.get("type").startswith("sensor.camera.rgb"):
-            actor.listen(lambda img: show_spectator(img))
 
-        sensors.append(actor)
+MAX_STEER_DEG = 35.0    # Model 3 Tire Angle
+KP_THR        = 0.25    # P acceleration gain
+KP_BRK        = 0.35    # P brake gain
+ROUTE_START_WARN_DIST = 5.0  # [m] vehicle to route start before the tracker warns
 
-    return sensors
 
+def _speed_mps(vec):
+    return float((vec.x**2 + vec.y**2 + vec.z**2) ** 0.5)
 
-def main(args):
 
-    world = None
-    vehicle = None
-    sensors = []
-    original_settings = None
+def _clamp(v, lo, hi):
+    return hi if v > hi else lo if v < lo else v
 
-    rclpy.init(args=None)
-    node = rclpy.create_node("carla_ros2_depth_bridge")
 
-    depth_colorizer = DepthColorizer(node, "/carla/hero/camera_depth/image_depth")
-    semantic_colorizer = SemanticColorizer(
-        node,
-        "/carla/hero/camera_semantic_segmentation/image_color"
-    )
+def _vehicle_control(v_meas, v_ref_mps, steer_deg, brake_manual=0.0):
+    """P speed law + steering angle [deg] (left: -, right: +) -> VehicleControl."""
+    steer_norm = _clamp(steer_deg / MAX_STEER_DEG, -1.0, 1.0)
 
-    try:
-        client = carla.Client(args.host, args.port)
-        client.set_timeout(10.0)
+    err = v_ref_mps - v_meas
+    thr_cmd = _clamp(KP_THR * max(err,  0.0), 0.0, 1.0)
+    brk_cmd = _clamp(KP_BRK * max(-err, 0.0), 0.0, 1.0)
 
-        world = client.get_world()
+    if brake_manual > 0.0:
+        brk_cmd = brake_manual
+        thr_cmd = 0.0
 
-        original_settings = world.get_settings()
-        settings = world.get_settings()
-        settings.synchronous_mode = True
-        settings.fixed_delta_seconds = 0.05
-        world.apply_settings(settings)
+    return carla.VehicleControl(throttle=thr_cmd, brake=brk_cmd, steer=steer_norm)
 
-        # traffic_manager = client.get_trafficmanager()
-        # traffic_manager.set_synchronous_mode(True)
 
-        with open(args.file) as f:
-            config = json.load(f)
+class EgoVehicle:
+    """One hero vehicle of the bridge: its sensors, ROS outputs and cmd_vel control."""
 
-        vehicle = _setup_vehicle(world, config)
-        sensors = _setup_sensors(
-            world,
-            vehicle,
-            config.get("sensors", []),
-            depth_colorizer=depth_colorizer,
-            semantic_colorizer=semantic_colorizer,
+    def __init__(self, node: Node, spec: VehicleSpec, vehicle, sensors, encode_pool: ThreadPoolExecutor = None,
+                 governor: LoadGovernor = None):
+        self.node = node
+        self.spec = spec
+        self.vehicle = vehicle
+        self.sensors = sensors
+        self.encode_pool = encode_pool
+        self.governor = governor
+        self.ros_prefix = "/carla/{}".format(spec.id)
+        self.streams = []
+        self.closables = []
+        self.tracker = None
+
+    def start(self):
+        """Create the ROS outputs, start listening on the sensors and subscribe to cmd_vel."""
+        self.streams, self.closables = _setup_sensors(
+            self.node, self.sensors, self.spec.sensors, self.ros_prefix,
+            encode_pool=self.encode_pool,
+            shm_prefix="carla_{}".format(self.spec.id),
+            governor=self.governor,
         )
 
-        _ = world.tick()
-        # vehicle.set_autopilot(False)
+        if self.spec.tracker is not None:
+            cfg = self.spec.tracker
+            loc = self.vehicle.get_transform().location
+            origin = cfg["origin"]
+            if origin is None:
+                origin = (loc.x, loc.y)
+            start = cfg["points"][0]
+            offset = math.hypot(loc.x - origin[0] - start[0], loc.y - origin[1] - start[1])
+            if offset > ROUTE_START_WARN_DIST:
+                self.node.get_logger().warn(
+                    f"[control] {self.spec.id} spawned {offset:.1f} m from the start of {cfg['route']}; "
+                    f"check tracker.origin / spawn_index")
+            self.tracker = PurePursuitTracker(
+                RouteIndex(cfg["points"]),
+                origin=origin,
+                target_speed=cfg["target_speed"],
+                lookahead=cfg["lookahead"],
+                lookahead_gain=cfg["lookahead_gain"],
+                wheelbase=cfg["wheelbase"],
+                goal_tolerance=cfg["goal_tolerance"],
+            )
+            self.node.get_logger().info(
+                f"[control] {self.spec.id} tracks {cfg['route']} "
+                f"({self.tracker.route.length:.1f} m, origin {origin[0]:.1f}, {origin[1]:.1f}); cmd_vel disabled")
+            return
+
+        topic = "{}/cmd_vel".format(self.ros_prefix)
+        # commands of one vehicle run in order, different vehicles run concurrently
+        self.node.create_subscription(Twist, topic, self._on_cmd, 10,
+                                      callback_group=MutuallyExclusiveCallbackGroup())
+        self.node.get_logger().info(f"[control] Subscribed {topic} (x=thr, y=brk, z=steer)")
+
+    def on_tick(self):
+        """Run the built-in tracker on the state after this tick; control applies to the next one."""
+        if self.tracker is None or self.tracker.done:
+            return
+
+        tf = self.vehicle.get_transform()
+        v_meas = _speed_mps(self.vehicle.get_velocity())
+        steer_deg, v_ref = self.tracker.step(tf.location.x, tf.location.y, tf.rotation.yaw, v_meas)
+
+        if self.tracker.done:
+            self.vehicle.apply_control(_vehicle_control(v_meas, 0.0, 0.0, brake_manual=1.0))
+            self._log_tracking("goal reached")
+            return
+
+        self.vehicle.apply_control(_vehicle_control(v_meas, v_ref, steer_deg))
+        if self.tracker.steps % self.spec.tracker["log_every"] == 0:
+            self._log_tracking("tracking")
+
+    def _log_tracking(self, what: str):
+        m = self.tracker.metrics()
+        self.node.get_logger().info(
+            f"[control] {self.spec.id} {what}: progress {m['progress'] * 100:.0f}%, "
+            f"cte mean {m['cte_mean']:.2f} m, rms {m['cte_rms']:.2f} m, max {m['cte_max']:.2f} m, "
+            f"now {self.tracker.last_cte:+.2f} m")
+
+    # === Twist(linear.x[m/s], angular.z[deg], linear.y[0..1]) -> VehicleControl ===
+    def _on_cmd(self, msg: Twist):
+        v_meas = _speed_mps(self.vehicle.get_velocity())  # current velocity [m/s]
+        self.vehicle.apply_control(_vehicle_control(
+            v_meas,
+            float(msg.linear.x),                        # target speed [m/s]
+            float(msg.angular.z),                       # [deg] (left: -, right: +)
+            _clamp(float(msg.linear.y), 0.0, 1.0),      # brake (optional)
+        ))
+
+    def destroy(self):
+        if self.tracker is not None and not self.tracker.done and self.tracker.steps:
+            self._log_tracking("stopped")
+        # no new callbacks once stopped; close() waits for one still in flight
+        for sensor in self.sensors:
+            sensor.stop()
+        for closable in self.closables:
+            closable.close()
+        for sensor in self.sensors:
+            sensor.destroy()
+        if self.vehicle:
+            self.vehicle.destroy()
+
+
+class Bridge:
+    """All ego vehicles of the process: one node, one encode pool, driven by one tick loop."""
+
+    def __init__(self, ctx: CarlaContext, specs: List[VehicleSpec], encode_workers: int = 4,
+                 callback_threads: int = 4, governor: bool = True, tick_budget: Optional[float] = None):
+        self.ctx = ctx
+        self.specs = specs
+        self.encode_workers = encode_workers
+        self.callback_threads = callback_threads
+        self.node = None
+        self.encode_pool = None
+        self.executor = None
+        self._executor_thread = None
+        self.egos = []
+        self.spectator = None
+
+        # without the governor streams always run at full rate and size
+        self.governor = LoadGovernor(tick_budget) if governor else None
+        self.diagnostics = None
+        self._last_tick = None
+
+    def setup(self):
+        """Create the node and spawn every rig. rclpy must be initialised."""
+        self.node = rclpy.create_node("carla_ros2_depth_bridge")
+        if self.governor is not None:
+            self.diagnostics = self.node.create_publisher(DiagnosticArray, "/diagnostics", 10)
+
+        # shared by all CompressedPublisher streams of all vehicles
+        self.encode_pool = ThreadPoolExecutor(max_workers=self.encode_workers, thread_name_prefix="encode")
+
+        rigs = spawn_rigs(self.ctx.client, self.ctx.world, self.specs, self.ctx.blueprints, self.ctx.spawn_points)
+        self.egos = [
+            EgoVehicle(self.node, spec, vehicle, sensors, encode_pool=self.encode_pool, governor=self.governor)
+            for spec, (vehicle, sensors) in zip(self.specs, rigs)
+        ]
+        for ego in self.egos:
+            ego.start()
 
-        MAX_STEER_DEG = 35.0    # Model 3 Tire Angle 
-        KP_THR        = 0.25    # P acceleration gain
-        KP_BRK        = 0.35    # P brake gain
+        # [추가] 서버의 메인 카메라(Spectator) 객체 가져오기
+        self.spectator = self.ctx.world.get_spectator()
+
+        # ROS callbacks are serviced here, independently of the tick loop
+        self.executor = MultiThreadedExecutor(num_threads=self.callback_threads)
+        self.executor.add_node(self.node)
+        self._executor_thread = threading.Thread(target=self.executor.spin, name="ros-executor", daemon=True)
+        self._executor_thread.start()
+
+    def on_tick(self, tick_seconds: float = 0.0):
+        """Per-tick work after world.tick(); tick_seconds is how long that tick took."""
+        for ego in self.egos:
+            ego.on_tick()
+
+        # [추가] 차량이 존재하면 카메라가 (첫 번째) 차량 뒤를 따라다니게 설정
+        followed = self.egos[0].vehicle if self.egos else None
+        if followed:
+            tf = followed.get_transform()
+            # 차량 위치에서 뒤로 5m, 위로 2.5m 떨어진 위치 계산
+            loc = tf.location - (tf.get_forward_vector() * 5.0)
+            loc.z += 2.5
+            # 카메라는 차량과 같은 방향을 바라보게(pitch는 -10도 아래로) 설정
+            rot = carla.Rotation(pitch=-10.0, yaw=tf.rotation.yaw, roll=0.0)
+            self.spectator.set_transform(carla.Transform(loc, rot))
+
+        if self.governor is not None:
+            self._govern(tick_seconds)
+
+    def _govern(self, tick_seconds: float):
+        now = time.monotonic()
+        wall = now - self._last_tick if self._last_tick is not None else tick_seconds
+        self._last_tick = now
+
+        adjustments = self.governor.on_tick(tick_seconds, wall)
+        if adjustments:
+            self._report(adjustments)
+
+    def _report(self, adjustments):
+        """Log every adjustment and publish it on /diagnostics."""
+        msg = DiagnosticArray()
+        msg.header.stamp = self.node.get_clock().now().to_msg()
+        for adj in adjustments:
+            stream, st = adj.stream, adj.stats
+            self.node.get_logger().info(
+                f"[load] {stream.name}: every {adj.decimation}. frame, scale {adj.scale:.2f} ({adj.reason})")
+
+            status = DiagnosticStatus()
+            status.level = DiagnosticStatus.WARN if stream.degraded else DiagnosticStatus.OK
+            status.name = "carla_bridge/{}".format(stream.name)
+            status.message = "degraded" if stream.degraded else "full rate"
+            status.hardware_id = stream.name.split("/", 1)[0]
+            status.values = [KeyValue(key=k, value=str(v)) for k, v in (
+                ("priority", stream.priority),
+                ("decimation", adj.decimation),
+                ("scale", "{:.2f}".format(adj.scale)),
+                ("proc_ms", "{:.2f}".format(st["proc_ms"])),
+                ("load", "{:.2f}".format(st["load"])),
+                ("queue", "{:.2f}".format(st["queue"])),
+                ("dropped", st["dropped"]),
+                ("reason", adj.reason),
+            )]
+            msg.status.append(status)
+        self.diagnostics.publish(msg)
+
+    def destroy(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self._executor_thread.join(timeout=2.0)
+            self.executor = None
+
+        for ego in self.egos:
+            ego.destroy()
+        self.egos = []
+
+        if self.encode_pool is not None:
+            self.encode_pool.shutdown(wait=True, cancel_futures=True)
 
-        def _speed_mps(vec):
-            return float((vec.x**2 + vec.y**2 + vec.z**2) ** 0.5)
+        try:
+            if self.node is not None:
+                self.node.destroy_node()
+        except Exception:
+            pass
 
-        def _clamp(v, lo, hi):
-            return hi if v > hi else lo if v < lo else v
 
-        # === Twist(linear.x[m/s], angular.z[deg], linear.y[0..1]) -> VehicleControl ===
-        def _on_cmd(msg: Twist):
-            v_meas = _speed_mps(vehicle.get_velocity()) # current velocity [m/s]
+def main(args):
+    t_launch = time.monotonic()
 
-            v_ref_mps   = float(msg.linear.x)     # target speed [m/s]
-            steer_deg   = float(msg.angular.z)    # [deg] (left: -, right: +)
-            brake_manual= _clamp(float(msg.linear.y), 0.0, 1.0)  # brake (optional)
+    # validate the whole rig before touching the simulator
+    with open(args.file) as f:
+        specs = parse_rig_config(json.load(f))
 
-            steer_norm = _clamp(steer_deg / MAX_STEER_DEG, -1.0, 1.0)
+    ctx = CarlaContext(args.host, args.port)
 
-            err = v_ref_mps - v_meas
-            thr_cmd = _clamp(KP_THR * max(err,  0.0), 0.0, 1.0)
-            brk_cmd = _clamp(KP_BRK * max(-err, 0.0), 0.0, 1.0)
+    rclpy.init(args=None)
+    bridge = Bridge(ctx, specs, encode_workers=args.encode_workers, callback_threads=args.callback_threads,
+                    governor=not args.no_governor, tick_budget=args.governor_tick_budget or None)
 
-            if brake_manual > 0.0:
-                brk_cmd = brake_manual
-                thr_cmd = 0.0
+    try:
+        ctx.enable_synchronous_mode(0.05)
 
-            vehicle.apply_control(carla.VehicleControl(
-                throttle=thr_cmd,
-                brake=brk_cmd,
-                steer=steer_norm
-            ))
+        # traffic_manager = client.get_trafficmanager()
+        # traffic_manager.set_synchronous_mode(True)
 
-        node.create_subscription(Twist, '/carla/hero/cmd_vel', _on_cmd, 10)
-        node.get_logger().info("[control] Subscribed /carla/hero/cmd_vel (x=thr, y=brk, z=steer)")
+        with ctx.timed("bridge"):
+            bridge.setup()
 
+        ctx.report()
+        _ = ctx.world.tick()
+        logging.info("{} vehicle(s), {} sensors ready in {:.2f}s".format(
+            len(bridge.egos), sum(len(ego.sensors) for ego in bridge.egos), time.monotonic() - t_launch))
 
         logging.info("Running...")
 
-        # [추가] 서버의 메인 카메라(Spectator) 객체 가져오기
-        spectator = world.get_spectator()
-
-        while rclpy.ok():
-            _ = world.tick()
-            rclpy.spin_once(node, timeout_sec=0.0)
-
-            # [추가] 차량이 존재하면 카메라가 차량 뒤를 따라다니게 설정
-            if vehicle:
-                tf = vehicle.get_transform()
-                # 차량 위치에서 뒤로 5m, 위로 2.5m 떨어진 위치 계산
-                loc = tf.location - (tf.get_forward_vector() * 5.0)
-                loc.z += 2.5
-                # 카메라는 차량과 같은 방향을 바라보게(pitch는 -10도 아래로) 설정
-                rot = carla.Rotation(pitch=-10.0, yaw=tf.rotation.yaw, roll=0.0)
-                spectator.set_transform(carla.Transform(loc, rot))
+        def _tick():
+            t0 = time.monotonic()
+            _ = ctx.world.tick()
+            bridge.on_tick(time.monotonic() - t0)
+
+        scheduler = TickScheduler(_tick, rate_hz=args.rate, deadline_policy=args.deadline)
+        scheduler.run(keep_running=rclpy.ok)
 
     except KeyboardInterrupt:
         print('\nCancelled by user. Bye!')
 
     finally:
-        if original_settings:
-            world.apply_settings(original_settings)
-
-        for sensor in sensors:
-            sensor.destroy()
-
-        if vehicle:
-            vehicle.destroy()
-
-        try:
-            node.destroy_node()
-        except Exception:
-            pass
+        ctx.restore_settings()
+        bridge.destroy()
         rclpy.shutdown()
         cv2.destroyAllWindows()
 
@@ -260,7 +1012,19 @@ if __name__ == '__main__':
     argparser.add_argument('--port', metavar='P', default=2000, type=int,
                            help='TCP port of CARLA Simulator (default: 2000)')
     argparser.add_argument('-f', '--file', default='', required=True,
-                           help='File to be executed (e.g. original_tesla.json)')
+                           help='File to be executed: one vehicle config or a list of them (e.g. tesla.json)')
+    argparser.add_argument('--encode-workers', metavar='N', default=os.cpu_count() or 4, type=int,
+                           help='worker threads for compressed image outputs (default: number of CPUs)')
+    argparser.add_argument('--rate', metavar='HZ', default=0.0, type=float,
+                           help='target tick rate, 0 = as fast as possible (default: 0)')
+    argparser.add_argument('--deadline', choices=DEADLINE_POLICIES, default='skip',
+                           help='what to do when a tick overruns its slot (default: skip)')
+    argparser.add_argument('--callback-threads', metavar='N', default=4, type=int,
+                           help='threads servicing ROS callbacks (default: 4)')
+    argparser.add_argument('--no-governor', action='store_true',
+                           help='never lower publish rate or resolution of sensors under load')
+    argparser.add_argument('--governor-tick-budget', metavar='SEC', default=0.0, type=float,
+                           help='also shed sensor load when a tick takes longer than this (default: 0 = off)')
     argparser.add_argument('-v', '--verbose', action='store_true', dest='debug',
                            help='print debug information')
 
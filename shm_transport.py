@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Shared-memory ring transport for camera frames on the same host.
+
+ros2_native.py writes every frame of a camera with a "shm" config into a ring
+of slots in one multiprocessing.shared_memory block and publishes only a small
+JSON descriptor (std_msgs/String) on /carla/<vehicle>/<sensor>/image/shm.
+
+Reader side (no CARLA needed):
+
+    from shm_transport import ShmFrameReader
+
+    reader = ShmFrameReader()
+
+    def on_descriptor(msg):
+        frame = reader.read(msg.data)   # numpy array (H, W, 3) or None if overwritten
+        ...
+
+    node.create_subscription(String, "/carla/hero/camera_front/image/shm", on_descriptor, 10)
+
+Slot layout: [seq u64][frame u64][pixels]. The writer makes seq odd while it
+copies a frame and even when done (seqlock), so a reader can tell if the slot
+was overwritten while it was reading.
+"""
+
+import json
+import os
+import sys
+from multiprocessing import shared_memory
+
+import numpy as np
+
+SLOT_HEADER = 16  # seq (u64) + frame (u64)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block without handing it to this process' resource tracker."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        # before 3.13 the tracker would unlink the writer's block when the reader exits
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
+    return shm
+
+
+def _close(shm: shared_memory.SharedMemory):
+    try:
+        shm.close()
+    except BufferError:
+        # the caller still holds a view (read(copy=False)); the mapping goes with it
+        pass
+
+
+def _slot_size(shape, dtype) -> int:
+    return SLOT_HEADER + int(np.prod(shape)) * np.dtype(dtype).itemsize
+
+
+class ShmFrameWriter:
+    """Ring of `slots` frames of fixed shape in one shared memory block."""
+
+    def __init__(self, name: str, shape, slots: int = 4, dtype=np.uint8):
+        if slots < 2:
+            raise ValueError("shm ring needs at least 2 slots")
+        self.name = name
+        self.shape = tuple(int(x) for x in shape)
+        self.dtype = np.dtype(dtype)
+        self.slots = int(slots)
+        self.slot_size = _slot_size(self.shape, self.dtype)
+        # tells readers that a block with the same name was recreated (e.g. bridge restart)
+        self.instance = os.urandom(8).hex()
+
+        size = self.slot_size * self.slots
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # left over from a crashed run; attach tracked, unlink() unregisters it again
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        self._headers = []
+        self._frames = []
+        for i in range(self.slots):
+            offset = i * self.slot_size
+            self._headers.append(np.ndarray((2,), dtype=np.uint64, buffer=self.shm.buf, offset=offset))
+            self._frames.append(np.ndarray(self.shape, dtype=self.dtype, buffer=self.shm.buf,
+                                           offset=offset + SLOT_HEADER))
+            self._headers[i][:] = 0
+        self._next = 0
+
+    def write(self, arr, frame: int) -> int:
+        """Copy one frame into the next slot and return the slot index."""
+        slot = self._next
+        self._next = (slot + 1) % self.slots
+        header = self._headers[slot]
+
+        header[0] += 1          # odd: write in progress
+        np.copyto(self._frames[slot], arr)
+        header[1] = frame
+        header[0] += 1          # even: slot consistent
+        return slot
+
+    def descriptor(self, slot: int, frame: int, stamp, encoding: str = "bgr8", frame_id: str = "") -> str:
+        return json.dumps({
+            "shm": self.name,
+            "slots": self.slots,
+            "slot": slot,
+            "frame": int(frame),
+            "stamp": [int(stamp.sec), int(stamp.nanosec)],
+            "frame_id": frame_id,
+            "shape": list(self.shape),
+            "dtype": self.dtype.str,
+            "encoding": encoding,
+            "instance": self.instance,
+        }, separators=(",", ":"))
+
+    def close(self):
+        self._headers = []
+        self._frames = []
+        try:
+            self.shm.close()
+        except BufferError:
+            # a frame is still being written; the mapping goes away with the last view
+            pass
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class ShmFrameReader:
+    """Maps the slots named by descriptors as numpy arrays. Blocks are attached lazily."""
+
+    def __init__(self):
+        # name -> (instance, SharedMemory)
+        self._blocks = {}
+
+    def _block(self, desc: dict) -> shared_memory.SharedMemory:
+        instance, shm = self._blocks.get(desc["shm"], (None, None))
+        if shm is None or instance != desc.get("instance"):
+            # first use, or the writer recreated the block under the same name
+            if shm is not None:
+                _close(shm)
+            shm = _attach(desc["shm"])
+            self._blocks[desc["shm"]] = (desc.get("instance"), shm)
+        return shm
+
+    def view(self, desc):
+        """Return (header, frame) numpy views of the slot in `desc` (no copy).
+
+        The writer reuses the slot after `slots` frames; check `is_current(desc)`
+        after using the view if you keep it around.
+        """
+        if isinstance(desc, str):
+            desc = json.loads(desc)
+        shm = self._block(desc)
+        shape = tuple(desc["shape"])
+        offset = desc["slot"] * _slot_size(shape, desc["dtype"])
+        header = np.ndarray((2,), dtype=np.uint64, buffer=shm.buf, offset=offset)
+        frame = np.ndarray(shape, dtype=np.dtype(desc["dtype"]), buffer=shm.buf, offset=offset + SLOT_HEADER)
+        return header, frame
+
+    def is_current(self, desc) -> bool:
+        if isinstance(desc, str):
+            desc = json.loads(desc)
+        header, _ = self.view(desc)
+        return int(header[0]) % 2 == 0 and int(header[1]) == desc["frame"]
+
+    def read(self, desc, copy: bool = True):
+        """Return the frame of `desc`, or None if the slot was overwritten meanwhile.
+
+        With copy=False the returned array is a view into shared memory.
+        """
+        if isinstance(desc, str):
+            desc = json.loads(desc)
+        header, frame = self.view(desc)
+        seq = int(header[0])
+        if seq % 2 or int(header[1]) != desc["frame"]:
+            return None
+        out = frame.copy() if copy else frame
+        if int(header[0]) != seq:
+            return None
+        return out
+
+    def close(self):
+        for _, shm in self._blocks.values():
+            _close(shm)
+        self._blocks = {}
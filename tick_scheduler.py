@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Fixed-rate (or free-running) tick loop with a deadline policy.
+
+The loop only runs the tick function and sleeps until the next slot on an
+Event, so an idle loop costs no CPU and stop() wakes it immediately. ROS
+callbacks are not serviced here; ros2_native.py spins its node in a
+MultiThreadedExecutor thread so subscription latency no longer depends on
+how long a tick takes.
+
+Deadline policies when a tick overruns its slot:
+  skip     drop the missed slots and continue at the next slot on the grid (default)
+  catchup  run the missed ticks back-to-back (at most `max_catchup`) to keep the tick count
+  reset    restart the grid from now
+"""
+
+import logging
+import threading
+import time
+
+DEADLINE_POLICIES = ("skip", "catchup", "reset")
+
+
+class TickScheduler:
+
+    def __init__(self, tick_fn, rate_hz: float = 0.0, deadline_policy: str = "skip",
+                 max_catchup: int = 5, report_every: float = 10.0):
+        if deadline_policy not in DEADLINE_POLICIES:
+            raise ValueError(f"deadline policy must be one of {', '.join(DEADLINE_POLICIES)}")
+        if rate_hz < 0:
+            raise ValueError("rate must be >= 0 (0 = as fast as possible)")
+        self.tick_fn = tick_fn
+        self.period = 1.0 / rate_hz if rate_hz > 0 else 0.0
+        self.deadline_policy = deadline_policy
+        self.max_catchup = max_catchup
+        self.report_every = report_every
+
+        self.ticks = 0
+        self.overruns = 0
+        self.skipped = 0
+        self._stop = threading.Event()
+
+    def stop(self):
+        self._stop.set()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    def run(self, keep_running=lambda: True):
+        """Tick until stop() is called or keep_running() returns False."""
+        next_slot = time.monotonic()
+        last_report = next_slot
+        reported_overruns = 0
+        # set while running missed ticks back-to-back; they are not new overruns
+        catching_up = False
+
+        while not self._stop.is_set() and keep_running():
+            self.tick_fn()
+            self.ticks += 1
+            if not self.period:
+                continue
+
+            next_slot += self.period
+            now = time.monotonic()
+            late = now - next_slot
+            if late > 0:
+                # a catch-up tick starts late by design; only the tick that fell behind counts
+                if not catching_up:
+                    self.overruns += 1
+                missed = int(late // self.period)
+                catching_up = self.deadline_policy == "catchup" and missed < self.max_catchup
+                if catching_up:
+                    # next tick starts right away; the grid stays where it was
+                    pass
+                elif self.deadline_policy == "reset":
+                    next_slot = now
+                else:
+                    self.skipped += missed + 1
+                    next_slot += (missed + 1) * self.period
+            else:
+                catching_up = False
+
+            if now - last_report >= self.report_every:
+                if self.overruns > reported_overruns:
+                    logging.warning("tick loop: %d of the last ticks overran the %.1f ms period (%d slots skipped)",
+                                    self.overruns - reported_overruns, self.period * 1000.0, self.skipped)
+                reported_overruns = self.overruns
+                last_report = now
+
+            delay = next_slot - time.monotonic()
+            if delay > 0:
+                self._stop.wait(delay)